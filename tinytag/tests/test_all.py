@@ -10,9 +10,11 @@
 from __future__ import annotations
 from typing import Any
 
+import copy
 import io
 import os
 import pathlib
+import pickle
 import shutil
 import sys
 
@@ -696,6 +698,16 @@ def test_mp3_length_estimation() -> None:
     assert 3.5 < tag.duration < 4.0
 
 
+@pytest.mark.parametrize("genre_id,expected", [
+    (1, {'genre': 'Blues'}),
+    (0, {}),
+    (1000, {}),
+])
+def test_mp4_id3v1_genre(genre_id: int, expected: dict[str, str]) -> None:
+    data_atom = b'\x00' * 8 + genre_id.to_bytes(2, 'big')
+    assert _MP4._Parser._parse_id3v1_genre(data_atom) == expected
+
+
 @pytest.mark.parametrize("path,cls", [
     ('samples/silence-44-s-v1.mp3', _Flac),
     ('samples/incomplete.mp3', _ID3),
@@ -742,6 +754,50 @@ def test_image_loading(path: str, expected_size: int) -> None:
     assert image.mime_type == 'image/jpeg'
 
 
+def flac_with_block_size(path: str, block_type: int, size: int) -> io.BytesIO:
+    with open(os.path.join(testfolder, path), 'rb') as file_handle:
+        data = bytearray(file_handle.read())
+    pos = 4  # jump over fLaC
+    while data[pos] & 0x7f != block_type:
+        pos += 4 + int.from_bytes(data[pos + 1:pos + 4], 'big')
+    data[pos + 1:pos + 4] = size.to_bytes(3, 'big')
+    return io.BytesIO(data)
+
+
+@pytest.mark.parametrize('size', [0, 126])
+def test_flac_short_vorbis_comment_block_size(size: int) -> None:
+    file_obj = flac_with_block_size(
+        'samples/flac_with_image.flac', _Flac.METADATA_VORBIS_COMMENT, size)
+    tag = TinyTag.get(file_obj=file_obj)
+    assert tag.title == 'intro'
+    assert tag.artist == 'Andreas Kümmert'
+    assert tag.duration == 83.56
+
+
+def test_image_loading_short_picture_block_size() -> None:
+    tag = TinyTag.get(
+        os.path.join(testfolder, 'samples/106-short-picture-block-size.flac'), image=True)
+    image = tag.images.any
+    assert image is not None
+    assert image.name == 'other'
+    assert image.mime_type == 'image/png'
+    assert image.description == 'Untitled.png'
+    assert len(image.data) == 79
+    assert image.data.startswith(b'\x89PNG')
+    assert tag.duration == 3.684716553287982
+
+
+@pytest.mark.parametrize('size', [60, 73288 - 20])
+def test_image_loading_picture_block_size_shorter_than_image(size: int) -> None:
+    file_obj = flac_with_block_size('samples/flac_with_image.flac', _Flac.METADATA_PICTURE, size)
+    tag = TinyTag.get(file_obj=file_obj, image=True)
+    image = tag.images.any
+    assert image is not None
+    assert len(image.data) == 73246
+    assert image.data.startswith(b'\xff\xd8\xff\xe0')
+    assert tag.title == 'intro'
+
+
 @pytest.mark.parametrize('path', [
     'samples/ogg_with_image.ogg',
 ])
@@ -762,6 +818,30 @@ def test_image_loading_extra(path: str) -> None:
     )
 
 
+@pytest.mark.parametrize('path', [
+    'samples/cover_img.mp3',
+    'samples/iso8859_with_image.m4a',
+    'samples/flac_with_image.flac',
+    'samples/ogg_with_image.ogg',
+    'samples/wav_with_image.wav',
+    'samples/aiff_with_image.aiff',
+])
+def test_image_pickle_and_copy(path: str) -> None:
+    tag = TinyTag.get(os.path.join(testfolder, path), image=True)
+    image = tag.images.any
+    assert image is not None
+    assert isinstance(vars(image)['data'], bytes)
+    for image_copy in (pickle.loads(pickle.dumps(image)), copy.deepcopy(image)):
+        assert image_copy.data == image.data
+        assert image_copy.mime_type == image.mime_type
+
+
+def test_image_not_in_extra_without_image_loading() -> None:
+    tag = TinyTag.get(os.path.join(testfolder, 'samples/ogg_with_image.ogg'))
+    assert 'metadata_block_picture' not in tag.extra
+    assert tag.images.any is None
+
+
 def test_mp3_utf_8_invalid_string() -> None:
     tag = TinyTag.get(os.path.join(testfolder, 'samples/utf-8-id3v2-invalid-string.mp3'))
     # the title used to be Gran dia, but I replaced the first byte with 0xFF,
@@ -769,6 +849,27 @@ def test_mp3_utf_8_invalid_string() -> None:
     assert tag.title == '�ran día'
 
 
+def test_id3v24_non_synchsafe_frame_size() -> None:
+    # some taggers write plain integers as v2.4 frame sizes, e.g. 0x00000082 for 130 bytes
+    title = b'T' * 129
+    frames = (b'TIT2\x00\x00\x00\x82\x00\x00\x00' + title
+              + b'TPE1\x00\x00\x00\x07\x00\x00\x00Artist')
+    header = b'ID3\x04\x00\x00\x00\x00' + bytes((len(frames) >> 7, len(frames) & 0x7f))
+    tag = TinyTag.get(file_obj=io.BytesIO(header + frames))
+    assert tag.title == title.decode()
+    assert tag.artist == 'Artist'
+    assert not tag.extra
+
+
+@pytest.mark.parametrize("bytestr,expected", [
+    (b'\x00\x00Title\x00', 'Title'),
+    (b'\x03\x00\x00Title\x00\x00', 'Title'),
+    (b'\x01\xff\xfe\x00\x00T\x00\x00\x00', 'T'),
+])
+def test_id3_strip_null_bytes(bytestr: bytes, expected: str) -> None:
+    assert _ID3()._decode_string(bytestr) == expected
+
+
 @pytest.mark.parametrize("testfile,expected", [
     ('samples/detect_mp3_id3.x', _ID3),
     ('samples/detect_mp3_fffb.x', _ID3),
@@ -15,10 +15,10 @@ mp3_with_image = os.path.join(sample_folder, 'id3image_without_description.mp3')
 bogus_file = os.path.join(sample_folder, 'there_is_no_such_ext.bogus')
 assert os.path.exists(mp3_with_image)
 
-tinytag_attributes = {'album', 'albumartist', 'artist', 'bitdepth', 'bitrate',
-                      'channels', 'comment', 'composer', 'disc', 'disc_total', 'duration', 'extra',
-                      'filesize', 'filename', 'genre', 'samplerate', 'title', 'track',
-                      'track_total', 'year'}
+tinytag_attributes = frozenset({
+    'album', 'albumartist', 'artist', 'bitdepth', 'bitrate', 'channels', 'comment', 'composer',
+    'disc', 'disc_total', 'duration', 'extra', 'filesize', 'filename', 'genre', 'samplerate',
+    'title', 'track', 'track_total', 'year'})
 
 
 def run_cli(args: str) -> str:
@@ -76,36 +76,34 @@ def test_meta_data_output_default_json() -> None:
     output = run_cli(mp3_with_image)
     data = json.loads(output)
     assert data
-    assert set(data.keys()) == tinytag_attributes
+    assert data.keys() == tinytag_attributes
 
 
 def test_meta_data_output_format_json() -> None:
     output = run_cli('-f json ' + mp3_with_image)
     data = json.loads(output)
     assert data
-    assert set(data.keys()) == tinytag_attributes
+    assert data.keys() == tinytag_attributes
 
 
 def test_meta_data_output_format_csv() -> None:
     output = run_cli('-f csv ' + mp3_with_image)
     lines = [line for line in output.split(os.linesep) if line]
     assert all(',' in line for line in lines)
-    attributes = set(line.split(',')[0] for line in lines)
-    assert set(attributes) == tinytag_attributes
+    assert {line.split(',', 1)[0] for line in lines} == tinytag_attributes
 
 
 def test_meta_data_output_format_tsv() -> None:
     output = run_cli('-f tsv ' + mp3_with_image)
     lines = [line for line in output.split(os.linesep) if line]
     assert all('\t' in line for line in lines)
-    attributes = set(line.split('\t')[0] for line in lines)
-    assert set(attributes) == tinytag_attributes
+    assert {line.split('\t', 1)[0] for line in lines} == tinytag_attributes
 
 
 def test_meta_data_output_format_tabularcsv() -> None:
     output = run_cli('-f tabularcsv ' + mp3_with_image)
     header, _line, _rest = output.split(os.linesep)
-    assert set(header.split(',')) == tinytag_attributes
+    assert frozenset(header.split(',')) == tinytag_attributes
 
 
 def test_fail_on_unsupported_file() -> None:
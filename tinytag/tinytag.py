@@ -37,16 +37,14 @@
 
 from __future__ import annotations
 from collections.abc import Callable, Iterator
-from functools import reduce
 from os import PathLike
-from sys import stderr
+from sys import intern, stderr
 from typing import Any, BinaryIO
 from warnings import warn
 
 import base64
 import io
 import os
-import re
 import struct
 
 
@@ -76,8 +74,16 @@ class TinyTag:
         '.aiff', '.aifc', '.aif', '.afc'
     )
     _EXTRA_PREFIX = 'extra.'
-    _file_extension_mapping: dict[tuple[str, ...], type[TinyTag]] | None = None
-    _magic_bytes_mapping: dict[bytes, type[TinyTag]] | None = None
+    _FIELDS = (
+        'filename', 'filesize', 'duration', 'channels', 'bitrate', 'bitdepth', 'samplerate',
+        'artist', 'albumartist', 'composer', 'album', 'disc', 'disc_total', 'title', 'track',
+        'track_total', 'genre', 'year', 'comment', 'extra', 'images',
+    )
+    _UPDATABLE_FIELDS = tuple(
+        field for field in _FIELDS if field not in {'filesize', 'extra', 'images'})
+    _file_extension_mapping: dict[str, type[TinyTag]] | None = None
+    _magic_bytes_mapping: dict[tuple[tuple[int, bytes], ...], type[TinyTag]] | None = None
+    _magic_bytes_header_size = 0
 
     def __init__(self) -> None:
         self.filename: bytes | str | PathLike[Any] | None = None
@@ -155,52 +161,64 @@ class TinyTag:
         return str(self._as_dict())
 
     def _as_dict(self) -> dict[str, Any]:
-        return {k: v for k, v in self.__dict__.items() if not k.startswith('_')}
+        return {field: getattr(self, field) for field in self._FIELDS}
 
     @classmethod
     def _get_parser_for_filename(
             cls, filename: bytes | str | PathLike[Any]) -> type[TinyTag] | None:
         if cls._file_extension_mapping is None:
             cls._file_extension_mapping = {
-                ('.mp1', '.mp2', '.mp3'): _ID3,
-                ('.oga', '.ogg', '.opus', '.spx'): _Ogg,
-                ('.wav',): _Wave,
-                ('.flac',): _Flac,
-                ('.wma',): _Wma,
-                ('.m4b', '.m4a', '.m4r', '.m4v', '.mp4', '.aax', '.aaxc'): _MP4,
-                ('.aiff', '.aifc', '.aif', '.afc'): _Aiff,
+                ext: tagclass
+                for exts, tagclass in (
+                    (('.mp1', '.mp2', '.mp3'), _ID3),
+                    (('.oga', '.ogg', '.opus', '.spx'), _Ogg),
+                    (('.wav',), _Wave),
+                    (('.flac',), _Flac),
+                    (('.wma',), _Wma),
+                    (('.m4b', '.m4a', '.m4r', '.m4v', '.mp4', '.aax', '.aaxc'), _MP4),
+                    (('.aiff', '.aifc', '.aif', '.afc'), _Aiff),
+                )
+                for ext in exts
             }
-        filename = os.fsdecode(filename).lower()
-        for ext, tagclass in cls._file_extension_mapping.items():
-            if filename.endswith(ext):
-                return tagclass
-        return None
+        filename = os.fsdecode(filename)
+        dot_pos = filename.rfind('.')
+        if dot_pos == -1:
+            return None
+        return cls._file_extension_mapping.get(filename[dot_pos:].lower())
 
     @classmethod
     def _get_parser_for_file_handle(cls, fh: BinaryIO) -> type[TinyTag] | None:
         # https://en.wikipedia.org/wiki/List_of_file_signatures
         if cls._magic_bytes_mapping is None:
+            # each signature is a tuple of (offset, literal bytes) pairs which must all match,
+            # most common formats first
             cls._magic_bytes_mapping = {
-                b'^ID3': _ID3,
-                b'^\xff\xfb': _ID3,
-                b'^OggS.........................FLAC': _Ogg,
-                b'^OggS........................Opus': _Ogg,
-                b'^OggS........................Speex': _Ogg,
-                b'^OggS.........................vorbis': _Ogg,
-                b'^RIFF....WAVE': _Wave,
-                b'^fLaC': _Flac,
-                b'^\x30\x26\xB2\x75\x8E\x66\xCF\x11\xA6\xD9\x00\xAA\x00\x62\xCE\x6C': _Wma,
-                b'....ftypM4A': _MP4,  # https://www.file-recovery.com/m4a-signature-format.htm
-                b'....ftypaax': _MP4,  # Audible proprietary M4A container
-                b'....ftypaaxc': _MP4,  # Audible proprietary M4A container
-                b'\xff\xf1': _MP4,  # https://www.garykessler.net/library/file_sigs.html
-                b'^FORM....AIFF': _Aiff,
-                b'^FORM....AIFC': _Aiff,
+                ((0, b'ID3'),): _ID3,
+                ((0, b'\xff\xfb'),): _ID3,
+                ((4, b'ftypM4A'),): _MP4,  # https://www.file-recovery.com/m4a-signature-format.htm
+                ((0, b'fLaC'),): _Flac,
+                ((0, b'RIFF'), (8, b'WAVE')): _Wave,
+                ((0, b'OggS'), (29, b'vorbis')): _Ogg,
+                ((0, b'OggS'), (28, b'Opus')): _Ogg,
+                ((0, b'OggS'), (29, b'FLAC')): _Ogg,
+                ((0, b'OggS'), (28, b'Speex')): _Ogg,
+                ((0, b'\x30\x26\xB2\x75\x8E\x66\xCF\x11\xA6\xD9\x00\xAA\x00\x62\xCE\x6C'),): _Wma,
+                ((0, b'FORM'), (8, b'AIFF')): _Aiff,
+                ((0, b'FORM'), (8, b'AIFC')): _Aiff,
+                ((4, b'ftypaax'),): _MP4,  # Audible proprietary M4A container
+                ((4, b'ftypaaxc'),): _MP4,  # Audible proprietary M4A container
+                ((0, b'\xff\xf1'),): _MP4,  # https://www.garykessler.net/library/file_sigs.html
             }
-        header = fh.read(max(len(sig) for sig in cls._magic_bytes_mapping))
+            cls._magic_bytes_header_size = max(
+                offset + len(literal)
+                for magic in cls._magic_bytes_mapping for offset, literal in magic)
+        header = fh.read(cls._magic_bytes_header_size)
         fh.seek(0)
         for magic, parser in cls._magic_bytes_mapping.items():
-            if re.match(magic, header):
+            for offset, literal in magic:
+                if not header.startswith(literal, offset):
+                    break
+            else:
                 return parser
         return None
 
@@ -253,16 +271,18 @@ class TinyTag:
         original_fieldname = fieldname
         if fieldname.startswith(self._EXTRA_PREFIX):
             write_dest = self.extra
-            fieldname = fieldname[len(self._EXTRA_PREFIX):]
+            fieldname = intern(fieldname[len(self._EXTRA_PREFIX):])
         old_value = write_dest.get(fieldname)
         if isinstance(value, str):
-            value = self._parse_string_field(original_fieldname, old_value, value)
+            if old_value or '\x00' in value:  # common case: new field with a single value
+                value = self._parse_string_field(original_fieldname, old_value, value)
             if not value:
                 return
         elif isinstance(value, list):
             if not isinstance(old_value, list):
                 old_value = []
-            value = old_value + [i for i in value if i and i not in old_value]
+            old_value.extend([i for i in value if i and i not in old_value])
+            value = old_value
         elif not value and old_value:
             return
         if DEBUG:
@@ -272,15 +292,11 @@ class TinyTag:
     def _set_image_field(self, fieldname: str, value: TagImage) -> None:
         write_dest = self.images.__dict__
         if fieldname.startswith(self._EXTRA_PREFIX):
-            fieldname = fieldname[len(self._EXTRA_PREFIX):]
+            fieldname = intern(fieldname[len(self._EXTRA_PREFIX):])
             write_dest = self.images.extra
-        old_values = write_dest.get(fieldname)
-        values = [value]
-        if old_values is not None:
-            values = old_values + values
         if DEBUG:
             print(f'Setting image field "{fieldname}"')
-        write_dest[fieldname] = values
+        write_dest.setdefault(fieldname, []).append(value)
 
     def _determine_duration(self, fh: BinaryIO) -> None:
         raise NotImplementedError
@@ -290,11 +306,9 @@ class TinyTag:
 
     def _update(self, other: TinyTag) -> None:
         # update the values of this tag with the values from another tag
-        excluded_attrs = {'filesize', 'extra', 'images'}
-        for standard_key, standard_value in other.__dict__.items():
-            if (not standard_key.startswith('_')
-                    and standard_key not in excluded_attrs
-                    and standard_value is not None):
+        for standard_key in self._UPDATABLE_FIELDS:
+            standard_value = getattr(other, standard_key)
+            if standard_value is not None:
                 self._set_field(standard_key, standard_value)
         for extra_key, extra_value in other.extra.items():
             self._set_field(self._EXTRA_PREFIX + extra_key, extra_value)
@@ -307,13 +321,7 @@ class TinyTag:
 
     @staticmethod
     def _bytes_to_int_le(b: bytes) -> int:
-        fmt = {1: '<B', 2: '<H', 4: '<I', 8: '<Q'}.get(len(b))
-        result: int = struct.unpack(fmt, b)[0] if fmt is not None else 0
-        return result
-
-    @staticmethod
-    def _bytes_to_int(b: tuple[int, ...]) -> int:
-        return reduce(lambda accu, elem: (accu << 8) + elem, b, 0)
+        return int.from_bytes(b, 'little')
 
     @staticmethod
     def _unpad(s: str) -> str:
@@ -336,6 +344,8 @@ class TinyTag:
 
 class TagImages:
     """A class containing images embedded in an audio file."""
+    _FIELDS = ('front_cover', 'back_cover', 'leaflet', 'media', 'other')
+
     def __init__(self) -> None:
         self.front_cover: list[TagImage] = []
         self.back_cover: list[TagImage] = []
@@ -361,10 +371,7 @@ class TagImages:
         return str(vars(self))
 
     def _as_dict(self) -> dict[str, list[TagImage]]:
-        return {
-            k: v for k, v in self.__dict__.items()
-            if not k.startswith('_') and k != 'extra'
-        }
+        return {field: getattr(self, field) for field in self._FIELDS}
 
 
 class TagImage:
@@ -388,8 +395,8 @@ class _MP4(TinyTag):
     # https://developer.apple.com/library/mac/documentation/QuickTime/QTFF/QTFFChap2/qtff2.html
 
     class _Parser:
-        atom_decoder_by_type: dict[
-            int, Callable[[bytes], int | str | bytes | TagImage]] | None = None
+        atom_decoder_by_type: tuple[
+            Callable[[memoryview], int | str | TagImage] | None, ...] | None = None
         _CUSTOM_FIELD_NAME_MAPPING = {
             'artists': 'artist',
             'conductor': 'extra.conductor',
@@ -406,70 +413,88 @@ class _MP4(TinyTag):
             'barcode': 'extra.barcode',
             'catalognumber': 'extra.catalog_number',
         }
+        _INT8 = struct.Struct('>b')
+        _UINT16 = struct.Struct('>H')
+        _UINT32 = struct.Struct('>I')
+        _INT64 = struct.Struct('>q')
+        _UINT16_X3 = struct.Struct('>3H')
+        _SIGNED_INTEGER_BY_SIZE = {
+            1: _INT8, 2: struct.Struct('>h'), 4: struct.Struct('>i'), 8: _INT64,
+        }
+        _UNSIGNED_INTEGER_BY_SIZE = {
+            1: struct.Struct('>B'), 2: _UINT16, 4: _UINT32, 8: struct.Struct('>Q'),
+        }
 
         @classmethod
-        def _unpack_integer(cls, value: bytes, signed: bool = True) -> int:
-            value_length = len(value)
-            result = -1
-            if value_length == 1:
-                result = struct.unpack('>b' if signed else '>B', value)[0]
-            elif value_length == 2:
-                result = struct.unpack('>h' if signed else '>H', value)[0]
-            elif value_length == 4:
-                result = struct.unpack('>i' if signed else '>I', value)[0]
-            elif value_length == 8:
-                result = struct.unpack('>q' if signed else '>Q', value)[0]
+        def _unpack_integer(cls, value: memoryview) -> int:
+            integer_struct = cls._SIGNED_INTEGER_BY_SIZE.get(len(value))
+            if integer_struct is None:
+                return -1
+            result: int = integer_struct.unpack(value)[0]
             return result
 
         @classmethod
-        def _unpack_integer_unsigned(cls, value: bytes) -> int:
-            return cls._unpack_integer(value, signed=False)
+        def _unpack_integer_unsigned(cls, value: memoryview) -> int:
+            integer_struct = cls._UNSIGNED_INTEGER_BY_SIZE.get(len(value))
+            if integer_struct is None:
+                return -1
+            result: int = integer_struct.unpack(value)[0]
+            return result
 
         @classmethod
         def _make_data_atom_parser(
                 cls, fieldname: str) -> Callable[[bytes], dict[str, int | str | bytes | TagImage]]:
+            atom_decoder_by_type = cls.atom_decoder_by_type
+            if atom_decoder_by_type is None:
+                # https://developer.apple.com/library/mac/documentation/QuickTime/QTFF/Metadata/Metadata.html#//apple_ref/doc/uid/TP40000939-CH1-SW34
+                decoder_by_type: dict[int, Callable[[memoryview], int | str | TagImage]] = {
+                    # 0: 'reserved'
+                    1: lambda x: str(x, 'utf-8', 'replace'),   # UTF-8
+                    2: lambda x: str(x, 'utf-16', 'replace'),  # UTF-16
+                    3: lambda x: str(x, 's/jis', 'replace'),   # S/JIS
+                    # 16: duration in millis
+                    13: lambda x: TagImage('front_cover', bytes(x), 'image/jpeg'),  # JPEG
+                    14: lambda x: TagImage('front_cover', bytes(x), 'image/png'),   # PNG
+                    21: cls._unpack_integer,                    # BE Signed int
+                    22: cls._unpack_integer_unsigned,           # BE Unsigned int
+                    # 23: lambda x: struct.unpack('>f', x)[0],  # BE Float32
+                    # 24: lambda x: struct.unpack('>d', x)[0],  # BE Float64
+                    # 27: lambda x: x,                          # BMP
+                    # 28: lambda x: x,                          # QuickTime Metadata atom
+                    65: cls._unpack_integer,                    # 8-bit Signed int
+                    66: cls._unpack_integer,                    # BE 16-bit Signed int
+                    67: cls._unpack_integer,                    # BE 32-bit Signed int
+                    74: cls._unpack_integer,                    # BE 64-bit Signed int
+                    75: cls._unpack_integer_unsigned,           # 8-bit Unsigned int
+                    76: cls._unpack_integer_unsigned,           # BE 16-bit Unsigned int
+                    77: cls._unpack_integer_unsigned,           # BE 32-bit Unsigned int
+                    78: cls._unpack_integer_unsigned,           # BE 64-bit Unsigned int
+                }
+                # data types are small integers, index a tuple instead of hashing
+                atom_decoder_by_type = cls.atom_decoder_by_type = tuple(
+                    decoder_by_type.get(data_type) for data_type in range(max(decoder_by_type) + 1))
+            max_data_type = len(atom_decoder_by_type) - 1
+            unpack_data_type = cls._UINT32.unpack_from
+
             def _parse_data_atom(data_atom: bytes) -> dict[str, int | str | bytes | TagImage]:
-                data_type = struct.unpack('>I', data_atom[:4])[0]
-                if cls.atom_decoder_by_type is None:
-                    # https://developer.apple.com/library/mac/documentation/QuickTime/QTFF/Metadata/Metadata.html#//apple_ref/doc/uid/TP40000939-CH1-SW34
-                    cls.atom_decoder_by_type = {
-                        # 0: 'reserved'
-                        1: lambda x: x.decode('utf-8', 'replace'),   # UTF-8
-                        2: lambda x: x.decode('utf-16', 'replace'),  # UTF-16
-                        3: lambda x: x.decode('s/jis', 'replace'),   # S/JIS
-                        # 16: duration in millis
-                        13: lambda x: TagImage('front_cover', x, 'image/jpeg'),  # JPEG
-                        14: lambda x: TagImage('front_cover', x, 'image/png'),   # PNG
-                        21: cls._unpack_integer,                    # BE Signed int
-                        22: cls._unpack_integer_unsigned,           # BE Unsigned int
-                        # 23: lambda x: struct.unpack('>f', x)[0],  # BE Float32
-                        # 24: lambda x: struct.unpack('>d', x)[0],  # BE Float64
-                        # 27: lambda x: x,                          # BMP
-                        # 28: lambda x: x,                          # QuickTime Metadata atom
-                        65: cls._unpack_integer,                    # 8-bit Signed int
-                        66: cls._unpack_integer,                    # BE 16-bit Signed int
-                        67: cls._unpack_integer,                    # BE 32-bit Signed int
-                        74: cls._unpack_integer,                    # BE 64-bit Signed int
-                        75: cls._unpack_integer_unsigned,           # 8-bit Unsigned int
-                        76: cls._unpack_integer_unsigned,           # BE 16-bit Unsigned int
-                        77: cls._unpack_integer_unsigned,           # BE 32-bit Unsigned int
-                        78: cls._unpack_integer_unsigned,           # BE 64-bit Unsigned int
-                    }
-                conversion = cls.atom_decoder_by_type.get(data_type)
+                data_type = unpack_data_type(data_atom)[0]
+                conversion = (
+                    atom_decoder_by_type[data_type] if data_type <= max_data_type else None)
                 if conversion is None:
                     if DEBUG:
                         print(f'Cannot convert data type: {data_type}', file=stderr)
                     return {}  # don't know how to convert data atom
                 # skip header & null-bytes, convert rest
-                return {fieldname: conversion(data_atom[8:])}
+                return {fieldname: conversion(memoryview(data_atom)[8:])}
             return _parse_data_atom
 
         @classmethod
         def _make_number_parser(
                 cls, fieldname1: str, fieldname2: str) -> Callable[[bytes], dict[str, int]]:
+            unpack_numbers = cls._UINT16_X3.unpack_from
+
             def _(data_atom: bytes) -> dict[str, int]:
-                number_data = data_atom[8:14]
-                numbers = struct.unpack('>HHH', number_data)
+                numbers = unpack_numbers(data_atom, 8)
                 # for some reason the first number is always irrelevant.
                 return {fieldname1: numbers[1], fieldname2: numbers[2]}
             return _
@@ -477,38 +502,34 @@ class _MP4(TinyTag):
         @classmethod
         def _parse_id3v1_genre(cls, data_atom: bytes) -> dict[str, str]:
             # dunno why the genre is offset by -1 but that's how mutagen does it
-            idx = struct.unpack('>H', data_atom[8:])[0] - 1
-            result = {}
-            if idx < len(_ID3._ID3V1_GENRES):
-                result['genre'] = _ID3._ID3V1_GENRES[idx]
-            return result
-
-        @classmethod
-        def _read_extended_descriptor(cls, esds_atom: BinaryIO) -> None:
-            for _i in range(4):
-                if esds_atom.read(1) != b'\x80':
-                    break
+            idx = cls._UINT16.unpack_from(data_atom, 8)[0] - 1
+            genres = _ID3._ID3V1_GENRES
+            if 0 <= idx < len(genres):
+                return {'genre': genres[idx]}
+            return {}
 
         @classmethod
         def _parse_custom_field(cls, data: bytes) -> dict[str, int | str | bytes | TagImage]:
-            fh = io.BytesIO(data)
             header_size = 8
             field_name = None
             data_atom = b''
-            atom_header = fh.read(header_size)
-            while len(atom_header) == header_size:
-                atom_size = struct.unpack('>I', atom_header[:4])[0] - header_size
-                atom_type = atom_header[4:]
-                if atom_type == b'name':
-                    atom_value = fh.read(atom_size)[4:].lower()
+            pos = 0
+            data_size = len(data)
+            unpack_atom_size = cls._UINT32.unpack_from
+            while pos + header_size <= data_size:
+                atom_size = unpack_atom_size(data, pos)[0] - header_size
+                if atom_size < 0:
+                    break  # invalid atom size
+                atom_type_pos = pos + 4  # compare atom type in place, without slicing
+                pos += header_size
+                if data.startswith(b'name', atom_type_pos):
+                    atom_value = data[pos + 4:pos + atom_size].lower()
                     field_name = atom_value.decode('utf-8', 'replace')
                     field_name = cls._CUSTOM_FIELD_NAME_MAPPING.get(
                         field_name, TinyTag._EXTRA_PREFIX + field_name)
-                elif atom_type == b'data':
-                    data_atom = fh.read(atom_size)
-                else:
-                    fh.seek(atom_size, os.SEEK_CUR)
-                atom_header = fh.read(header_size)  # read next atom
+                elif data.startswith(b'data', atom_type_pos):
+                    data_atom = data[pos:pos + atom_size]
+                pos += atom_size  # jump to next atom
             if len(data_atom) < 8 or field_name is None:
                 return {}
             parser = cls._make_data_atom_parser(field_name)
@@ -520,62 +541,55 @@ class _MP4(TinyTag):
             # https://ffmpeg.org/doxygen/0.6/mov_8c-source.html
             # http://xhelmboyx.tripod.com/formats/mp4-layout.txt
             # http://sasperger.tistory.com/103
-            datafh = io.BytesIO(data)
-            datafh.seek(16, os.SEEK_CUR)  # jump over version and flags
-            channels = struct.unpack('>H', datafh.read(2))[0]
-            datafh.seek(2, os.SEEK_CUR)   # jump over bit_depth
-            datafh.seek(2, os.SEEK_CUR)   # jump over QT compr id & pkt size
-            sr = struct.unpack('>I', datafh.read(4))[0]
+            channels = cls._UINT16.unpack_from(data, 16)[0]  # after version and flags
+            sr = cls._UINT32.unpack_from(data, 22)[0]  # after bit_depth, QT compr id & pkt size
 
             # ES Description Atom
-            esds_atom_size = struct.unpack('>I', data[28:32])[0]
-            esds_atom = io.BytesIO(data[36:36 + esds_atom_size])
-            esds_atom.seek(5, os.SEEK_CUR)   # jump over version, flags and tag
+            esds_atom_size = cls._UINT32.unpack_from(data, 28)[0]
+            esds_atom = memoryview(data)[36:36 + esds_atom_size]
+            pos = 5  # jump over version, flags and tag
 
-            # ES Descriptor
-            cls._read_extended_descriptor(esds_atom)
-            esds_atom.seek(4, os.SEEK_CUR)   # jump over ES id, flags and tag
+            # ES Descriptor (skip up to three 0x80 extension bytes and the size byte)
+            size_pos = pos + 3
+            while pos < size_pos and esds_atom[pos] == 0x80:
+                pos += 1
+            pos += 1 + 4  # jump over size, ES id, flags and tag
 
             # Decoder Config Descriptor
-            cls._read_extended_descriptor(esds_atom)
-            esds_atom.seek(9, os.SEEK_CUR)
-            avg_br = struct.unpack('>I', esds_atom.read(4))[0] / 1000  # kbit/s
+            size_pos = pos + 3
+            while pos < size_pos and esds_atom[pos] == 0x80:
+                pos += 1
+            pos += 1 + 9
+            avg_br = cls._UINT32.unpack_from(esds_atom, pos)[0] / 1000  # kbit/s
             return {'channels': channels, 'samplerate': sr, 'bitrate': avg_br}
 
         @classmethod
         def _parse_audio_sample_entry_alac(cls, data: bytes) -> dict[str, int]:
             # https://github.com/macosforge/alac/blob/master/ALACMagicCookieDescription.txt
-            alac_atom_size = struct.unpack('>I', data[28:32])[0]
-            alac_atom = io.BytesIO(data[36:36 + alac_atom_size])
-            alac_atom.seek(9, os.SEEK_CUR)
-            bitdepth = struct.unpack('b', alac_atom.read(1))[0]
-            alac_atom.seek(3, os.SEEK_CUR)
-            channels = struct.unpack('b', alac_atom.read(1))[0]
-            alac_atom.seek(6, os.SEEK_CUR)
-            avg_br = struct.unpack('>I', alac_atom.read(4))[0] / 1000  # kbit/s
-            sr = struct.unpack('>I', alac_atom.read(4))[0]
+            # the ALAC specific config starts at offset 36 (after the 8 byte atom header)
+            bitdepth = cls._INT8.unpack_from(data, 36 + 9)[0]
+            channels = cls._INT8.unpack_from(data, 36 + 13)[0]
+            avg_br = cls._UINT32.unpack_from(data, 36 + 20)[0] / 1000  # kbit/s
+            sr = cls._UINT32.unpack_from(data, 36 + 24)[0]
             return {'channels': channels, 'samplerate': sr, 'bitrate': avg_br, 'bitdepth': bitdepth}
 
         @classmethod
         def _parse_mvhd(cls, data: bytes) -> dict[str, float]:
             # http://stackoverflow.com/a/3639993/1191373
-            walker = io.BytesIO(data)
-            version = struct.unpack('b', walker.read(1))[0]
-            walker.seek(3, os.SEEK_CUR)  # jump over flags
+            version = cls._INT8.unpack_from(data)[0]
+            # jump over version, flags and create & mod times
             if version == 0:  # uses 32 bit integers for timestamps
-                walker.seek(8, os.SEEK_CUR)  # jump over create & mod times
-                time_scale = struct.unpack('>I', walker.read(4))[0]
-                duration = struct.unpack('>I', walker.read(4))[0]
+                time_scale = cls._UINT32.unpack_from(data, 12)[0]
+                duration = cls._UINT32.unpack_from(data, 16)[0]
             else:  # version == 1:  # uses 64 bit integers for timestamps
-                walker.seek(16, os.SEEK_CUR)  # jump over create & mod times
-                time_scale = struct.unpack('>I', walker.read(4))[0]
-                duration = struct.unpack('>q', walker.read(8))[0]
+                time_scale = cls._UINT32.unpack_from(data, 20)[0]
+                duration = cls._INT64.unpack_from(data, 24)[0]
             return {'duration': duration / time_scale}
 
     # The parser tree: Each key is an atom name which is traversed if existing.
     # Leaves of the parser tree are callables which receive the atom data.
     # callables return {fieldname: value} which is updates the TinyTag.
-    _META_DATA_TREE = {b'moov': {b'udta': {b'meta': {b'ilst': {
+    _ILST_TREE = {
         # see: http://atomicparsley.sourceforge.net/mpeg-4files.html
         # and: https://metacpan.org/dist/Image-ExifTool/source/lib/Image/ExifTool/QuickTime.pm#L3093
         b'\xa9ART': {b'data': _Parser._make_data_atom_parser('artist')},
@@ -589,7 +603,7 @@ class _MP4(TinyTag):
         b'\xa9dir': {b'data': _Parser._make_data_atom_parser('extra.director')},
         b'\xa9gen': {b'data': _Parser._make_data_atom_parser('genre')},
         b'\xa9lyr': {b'data': _Parser._make_data_atom_parser('extra.lyrics')},
-        b'\xa9mvn': {b'data': _Parser._make_data_atom_parser('movement')},
+        b'\xa9mvn': {b'data': _Parser._make_data_atom_parser('extra.movement')},
         b'\xa9nam': {b'data': _Parser._make_data_atom_parser('title')},
         b'\xa9pub': {b'data': _Parser._make_data_atom_parser('extra.publisher')},
         b'\xa9too': {b'data': _Parser._make_data_atom_parser('extra.encoded_by')},
@@ -603,7 +617,8 @@ class _MP4(TinyTag):
         b'tmpo': {b'data': _Parser._make_data_atom_parser('extra.bpm')},
         b'covr': {b'data': _Parser._make_data_atom_parser('images.front_cover')},
         b'----': _Parser._parse_custom_field,
-    }}}}}
+    }
+    _META_DATA_TREE = {b'moov': {b'udta': {b'meta': {b'ilst': _ILST_TREE}}}}
 
     # see: https://developer.apple.com/library/mac/documentation/QuickTime/QTFF/QTFFChap3/qtff3.html
     _AUDIO_DATA_TREE = {
@@ -616,91 +631,106 @@ class _MP4(TinyTag):
         }
     }
 
-    _VERSIONED_ATOMS = {b'meta', b'stsd'}  # those have an extra 4 byte header
-    _FLAGGED_ATOMS = {b'stsd'}  # these also have an extra 4 byte header
+    _VERSIONED_ATOMS = frozenset({b'meta', b'stsd'})  # those have an extra 4 byte header
+    _FLAGGED_ATOMS = frozenset({b'stsd'})  # these also have an extra 4 byte header
+    _IMAGE_ATOMS = frozenset({b'covr'})  # only read if images are requested
+    _AUDIO_DATA_FIELDS = ('duration', 'samplerate')  # stop traversal once these are known
 
     def _determine_duration(self, fh: BinaryIO) -> None:
-        self._traverse_atoms(fh, path=self._AUDIO_DATA_TREE)
+        self._traverse_atoms(fh, path=self._AUDIO_DATA_TREE, stop_fields=self._AUDIO_DATA_FIELDS)
 
     def _parse_tag(self, fh: BinaryIO) -> None:
         self._traverse_atoms(fh, path=self._META_DATA_TREE)
 
     def _traverse_atoms(self, fh: BinaryIO, path: dict[bytes, Any],
-                        stop_pos: int | None = None,
-                        curr_path: list[bytes] | None = None) -> None:
+                        stop_fields: tuple[str, ...] = ()) -> None:
         header_size = 8
-        atom_header = fh.read(header_size)
+        versioned_atoms = self._VERSIONED_ATOMS
+        flagged_atoms = self._FLAGGED_ATOMS
+        skipped_atoms = frozenset() if self._load_image else self._IMAGE_ATOMS
+        unpack_atom_size = self._Parser._UINT32.unpack_from
+        read = fh.read
+        seek = fh.seek
+        debug = DEBUG
+        # parent branches we descended from, and the end position of the current one
+        stack: list[tuple[dict[bytes, Any], int | None]] = []
+        stop_pos: int | None = None
+        atom_header = read(header_size)
         while len(atom_header) == header_size:
-            atom_size = struct.unpack('>I', atom_header[:4])[0] - header_size
+            atom_size = unpack_atom_size(atom_header)[0] - header_size
             atom_type = atom_header[4:]
-            if curr_path is None:  # keep track how we traversed in the tree
-                curr_path = [atom_type]
             if atom_size <= 0:  # empty atom, jump to next one
-                atom_header = fh.read(header_size)
+                atom_header = read(header_size)
                 continue
-            if DEBUG:
-                print(f'{" " * 4 * len(curr_path)} pos: {fh.tell() - header_size} '
+            if debug:
+                print(f'{" " * 4 * (len(stack) + 1)} pos: {fh.tell() - header_size} '
                       f'atom: {atom_type!r} len: {atom_size + header_size}')
-            if atom_type in self._VERSIONED_ATOMS:  # jump atom version for now
-                fh.seek(4, os.SEEK_CUR)
-            if atom_type in self._FLAGGED_ATOMS:  # jump atom flags for now
-                fh.seek(4, os.SEEK_CUR)
-            sub_path = path.get(atom_type, None)
+            if atom_type in versioned_atoms:  # jump atom version for now
+                seek(4, os.SEEK_CUR)
+            if atom_type in flagged_atoms:  # jump atom flags for now
+                seek(4, os.SEEK_CUR)
+            # don't read (potentially large) image data unless requested
+            sub_path = path.get(atom_type) if atom_type not in skipped_atoms else None
             # if the path leaf is a dict, traverse deeper into the tree:
             if isinstance(sub_path, dict):
-                atom_end_pos = fh.tell() + atom_size
-                self._traverse_atoms(fh, path=sub_path, stop_pos=atom_end_pos,
-                                     curr_path=curr_path + [atom_type])
+                stack.append((path, stop_pos))
+                path = sub_path
+                stop_pos = fh.tell() + atom_size
+                atom_header = read(header_size)
+                continue
             # if the path-leaf is a callable, call it on the atom data
-            elif callable(sub_path):
-                for fieldname, value in sub_path(fh.read(atom_size)).items():
-                    if DEBUG:
-                        print(' ' * 4 * len(curr_path), 'FIELD: ', fieldname)
+            if callable(sub_path):
+                for fieldname, value in sub_path(read(atom_size)).items():
+                    if debug:
+                        print(' ' * 4 * (len(stack) + 1), 'FIELD: ', fieldname)
                     if fieldname.startswith('images.'):
                         if self._load_image:
                             self._set_image_field(fieldname[len('images.'):], value)
                     elif fieldname:
                         self._set_field(fieldname, value)
+                # skip remaining atoms (e.g. video and subtitle traks) if we have all we need
+                if stop_fields and all(getattr(self, f) is not None for f in stop_fields):
+                    return
             # if no action was specified using dict or callable, jump over atom
             else:
-                fh.seek(atom_size, os.SEEK_CUR)
-            # check if we have reached the end of this branch:
-            if stop_pos and fh.tell() >= stop_pos:
-                return  # return to parent (next parent node in tree)
-            atom_header = fh.read(header_size)  # read next atom
+                seek(atom_size, os.SEEK_CUR)
+            # check if we have reached the end of this branch (and possibly its parents):
+            while stop_pos and fh.tell() >= stop_pos:
+                path, stop_pos = stack.pop()  # return to parent (next parent node in tree)
+            atom_header = read(header_size)  # read next atom
 
 
 class _ID3(TinyTag):
     _ID3_MAPPING = {
         # Mapping from Frame ID to a field of the TinyTag
         # https://exiftool.org/TagNames/ID3.html
-        'COMM': 'comment', 'COM': 'comment',
-        'TRCK': 'track', 'TRK': 'track',
-        'TYER': 'year', 'TYE': 'year', 'TDRC': 'year',
-        'TALB': 'album', 'TAL': 'album',
-        'TPE1': 'artist', 'TP1': 'artist',
-        'TIT2': 'title', 'TT2': 'title',
-        'TCON': 'genre', 'TCO': 'genre',
-        'TPOS': 'disc', 'TPA': 'disc',
-        'TPE2': 'albumartist', 'TP2': 'albumartist',
-        'TCOM': 'composer', 'TCM': 'composer',
-        'WOAR': 'extra.url', 'WAR': 'extra.url',
-        'TSRC': 'extra.isrc', 'TRC': 'extra.isrc',
-        'TCOP': 'extra.copyright', 'TCR': 'extra.copyright',
-        'TBPM': 'extra.bpm', 'TBP': 'extra.bpm',
-        'TKEY': 'extra.initial_key', 'TKE': 'extra.initial_key',
-        'TLAN': 'extra.language', 'TLA': 'extra.language',
-        'TPUB': 'extra.publisher', 'TPB': 'extra.publisher',
-        'USLT': 'extra.lyrics', 'ULT': 'extra.lyrics',
-        'TPE3': 'extra.conductor', 'TP3': 'extra.conductor',
-        'TEXT': 'extra.lyricist', 'TXT': 'extra.lyricist',
-        'TSST': 'extra.set_subtitle',
-        'TENC': 'extra.encoded_by', 'TEN': 'extra.encoded_by',
-        'TSSE': 'extra.encoder_settings', 'TSS': 'extra.encoder_settings',
-        'TMED': 'extra.media', 'TMT': 'extra.media',
-        'TDOR': 'extra.original_date',
-        'TORY': 'extra.original_year', 'TOR': 'extra.original_year',
-        'WCOP': 'extra.license',
+        b'COMM': 'comment', b'COM': 'comment',
+        b'TRCK': 'track', b'TRK': 'track',
+        b'TYER': 'year', b'TYE': 'year', b'TDRC': 'year',
+        b'TALB': 'album', b'TAL': 'album',
+        b'TPE1': 'artist', b'TP1': 'artist',
+        b'TIT2': 'title', b'TT2': 'title',
+        b'TCON': 'genre', b'TCO': 'genre',
+        b'TPOS': 'disc', b'TPA': 'disc',
+        b'TPE2': 'albumartist', b'TP2': 'albumartist',
+        b'TCOM': 'composer', b'TCM': 'composer',
+        b'WOAR': 'extra.url', b'WAR': 'extra.url',
+        b'TSRC': 'extra.isrc', b'TRC': 'extra.isrc',
+        b'TCOP': 'extra.copyright', b'TCR': 'extra.copyright',
+        b'TBPM': 'extra.bpm', b'TBP': 'extra.bpm',
+        b'TKEY': 'extra.initial_key', b'TKE': 'extra.initial_key',
+        b'TLAN': 'extra.language', b'TLA': 'extra.language',
+        b'TPUB': 'extra.publisher', b'TPB': 'extra.publisher',
+        b'USLT': 'extra.lyrics', b'ULT': 'extra.lyrics',
+        b'TPE3': 'extra.conductor', b'TP3': 'extra.conductor',
+        b'TEXT': 'extra.lyricist', b'TXT': 'extra.lyricist',
+        b'TSST': 'extra.set_subtitle',
+        b'TENC': 'extra.encoded_by', b'TEN': 'extra.encoded_by',
+        b'TSSE': 'extra.encoder_settings', b'TSS': 'extra.encoder_settings',
+        b'TMED': 'extra.media', b'TMT': 'extra.media',
+        b'TDOR': 'extra.original_date',
+        b'TORY': 'extra.original_year', b'TOR': 'extra.original_year',
+        b'WCOP': 'extra.license',
     }
     _ID3_MAPPING_CUSTOM = {
         'artists': 'artist',
@@ -710,12 +740,15 @@ class _ID3(TinyTag):
         'barcode': 'extra.barcode',
         'catalognumber': 'extra.catalog_number',
     }
-    _IMAGE_FRAME_IDS = {'APIC', 'PIC'}
-    _CUSTOM_FRAME_IDS = {'TXXX', 'TXX'}
-    _DISALLOWED_FRAME_IDS = {'PRIV', 'RGAD', 'GEOB', 'GEO', 'ÿû°d'}
+    _IMAGE_FRAME_IDS = frozenset({b'APIC', b'PIC'})
+    _CUSTOM_FRAME_IDS = frozenset({b'TXXX', b'TXX'})
+    _DISALLOWED_FRAME_IDS = frozenset({b'PRIV', b'RGAD', b'GEOB', b'GEO', b'\xff\xfb\xb0d'})
+    _UTF16_BOMS = frozenset({b'\xfe\xff', b'\xff\xfe'})
     _MAX_ESTIMATION_SEC = 30.0
     _CBR_DETECTION_FRAME_COUNT = 5
     _USE_XING_HEADER = True  # much faster, but can be deactivated for testing
+    _READ_CHUNK_SIZE = 65536  # audio data is read in chunks while looking for frames
+    _MIN_BUFFERED_BYTES = 8192  # more than the largest possible frame
 
     _ID3V1_GENRES = (
         'Blues', 'Classic Rock', 'Country', 'Dance', 'Disco',
@@ -812,6 +845,19 @@ class _ID3(TinyTag):
         (_NONE, _V2L3, _V2L2, _V2L1),  # MPEG Version 2    # the first layer id is
         (_NONE, _V1L3, _V1L2, _V1L1),  # MPEG Version 1    # reserved
     )
+    # (mpeg_id, bitrate, samplerate) of every valid frame header, indexed by its upper 22 bits
+    # (sync, version, layer, protection, bitrate and sample rate ids)
+    _FRAME_INFO_BY_HEADER = {
+        0x7FF << 11 | mpeg_id << 9 | layer_id << 7 | protection << 6 | br_id << 2 | sr_id:
+            (mpeg_id, bitrate, samplerate)
+        for mpeg_id, layers, samplerates in zip(
+            range(4), _BITRATE_BY_VERSION_BY_LAYER, _SAMPLE_RATES)
+        for layer_id, bitrates in enumerate(layers)
+        for br_id, bitrate in enumerate(bitrates)
+        for sr_id, samplerate in enumerate(samplerates)
+        for protection in (0, 1)
+        if bitrate and samplerate
+    }
     _SAMPLES_PER_FRAME = 1152  # the default frame size for mp3
     _CHANNELS_PER_CHANNEL_MODE = (
         2,  # 00 Stereo
@@ -819,6 +865,15 @@ class _ID3(TinyTag):
         2,  # 10 Dual channel (2 mono channels)
         1,  # 11 Single channel (Mono)
     )
+    _INT32 = struct.Struct('>i')
+    _ID3V2_HEADER = struct.Struct('3sBBB4B')
+    _ID3V22_FRAME_HEADER = struct.Struct('3s3B')
+    _ID3V2_FRAME_HEADER = struct.Struct('4s4B2B')
+    # frame header struct, size field length and bits per size byte, chosen once per tag
+    # ID3v2.2 especially ugly. see: http://id3.org/id3v2-00
+    _ID3V22_FRAME_LAYOUT = (_ID3V22_FRAME_HEADER, 3, 8)
+    _ID3V23_FRAME_LAYOUT = (_ID3V2_FRAME_HEADER, 4, 8)
+    _ID3V24_FRAME_LAYOUT = (_ID3V2_FRAME_HEADER, 4, 7)  # only id3v2.4 is synchsafe
 
     def __init__(self) -> None:
         super().__init__()
@@ -826,19 +881,18 @@ class _ID3(TinyTag):
         self._bytepos_after_id3v2 = -1
 
     @staticmethod
-    def _parse_xing_header(fh: BinaryIO) -> tuple[int, int]:
+    def _parse_xing_header(data: bytes, pos: int) -> tuple[int, int]:
         # see: http://www.mp3-tech.org/programmer/sources/vbrheadersdk.zip
-        fh.seek(4, os.SEEK_CUR)  # read over Xing header
-        header_flags = struct.unpack('>i', fh.read(4))[0]
+        pos += 4  # read over Xing header
+        header_flags = _ID3._INT32.unpack_from(data, pos)[0]
+        pos += 4
         frames = byte_count = 0
         if header_flags & 1:  # FRAMES FLAG
-            frames = struct.unpack('>i', fh.read(4))[0]
+            frames = _ID3._INT32.unpack_from(data, pos)[0]
+            pos += 4
         if header_flags & 2:  # BYTES FLAG
-            byte_count = struct.unpack('>i', fh.read(4))[0]
-        if header_flags & 4:  # TOC FLAG
-            fh.seek(100, os.SEEK_CUR)
-        if header_flags & 8:  # VBR SCALE FLAG
-            fh.seek(4, os.SEEK_CUR)
+            byte_count = _ID3._INT32.unpack_from(data, pos)[0]
+        # TOC and VBR scale are not needed
         return frames, byte_count
 
     def _determine_duration(self, fh: BinaryIO) -> None:
@@ -851,71 +905,81 @@ class _ID3(TinyTag):
         audio_offset = 0
         frames = 0  # count frames for determining mp3 duration
         bitrate_accu = 0    # add up bitrates to find average bitrate to detect
-        last_bitrates = set()  # CBR mp3s (multiple frames with same bitrates)
+        first_bitrate = 0  # CBR mp3s (multiple frames with same bitrates)
+        is_constant_bitrate = True
         # seek to first position after id3 tag (speedup for large header)
         first_mpeg_id = None
         fh.seek(self._bytepos_after_id3v2)
-        file_offset = fh.tell()
-        walker = io.BytesIO(fh.read())
+        file_offset = fh.tell()  # file position of data[0]
+        data = b''
+        data_size = pos = 0
+        eof = False
+        read = fh.read
+        read_chunk_size = self._READ_CHUNK_SIZE
+        min_buffered_bytes = self._MIN_BUFFERED_BYTES
+        channels_per_channel_mode = self._CHANNELS_PER_CHANNEL_MODE
+        frame_info_by_header = self._FRAME_INFO_BY_HEADER
+        use_xing_header = self._USE_XING_HEADER
+        cbr_detection_frame_count = self._CBR_DETECTION_FRAME_COUNT
         while True:
+            if not eof and data_size - pos < min_buffered_bytes:
+                # keep the remaining bytes and append the next chunk
+                if pos > data_size:
+                    fh.seek(pos - data_size, os.SEEK_CUR)
+                chunk = read(read_chunk_size)
+                eof = len(chunk) < read_chunk_size
+                data = data[pos:] + chunk
+                data_size = len(data)
+                file_offset += pos
+                pos = 0
             # reading through garbage until 11 '1' sync-bits are found
-            header = walker.read(4)
-            header_len = len(header)
-            walker.seek(-header_len, os.SEEK_CUR)
-            if header_len < 4:
+            header = data[pos:pos + 4]
+            if len(header) < 4:
                 if frames:
                     self.bitrate = bitrate_accu / frames
                 break  # EOF
-            _sync, conf, bitrate_freq, rest = struct.unpack('BBBB', header)
-            br_id = (bitrate_freq >> 4) & 0x0F  # biterate id
-            sr_id = (bitrate_freq >> 2) & 0x03  # sample rate id
-            padding = 1 if bitrate_freq & 0x02 > 0 else 0
-            mpeg_id = (conf >> 3) & 0x03
-            layer_id = (conf >> 1) & 0x03
-            channel_mode = (rest >> 6) & 0x03
-            # check for eleven 1s, validate bitrate and sample rate
-            if (not header[:2] > b'\xFF\xE0'
-                    or (first_mpeg_id is not None and first_mpeg_id != mpeg_id)
-                    or br_id > 14 or br_id == 0 or sr_id == 3 or layer_id == 0 or mpeg_id == 1):
-                idx = header.find(b'\xFF', 1)  # invalid frame, find next sync header
-                if idx == -1:
-                    idx = header_len  # not found: jump over the current peek buffer
-                walker.seek(max(idx, 1), os.SEEK_CUR)
+            frame_header = int.from_bytes(header, 'big')
+            # check for eleven 1s, validate version, layer, bitrate and sample rate
+            frame_info = frame_info_by_header.get(frame_header >> 10)
+            if frame_info is None or (first_mpeg_id is not None
+                                      and first_mpeg_id != frame_info[0]):
+                # invalid frame, find next sync header in the remaining data
+                idx = data.find(b'\xFF', pos + 1)
+                pos = idx if idx != -1 else data_size  # not found: jump to the end
                 continue
+            mpeg_id, frame_bitrate, samplerate = frame_info
+            padding = (frame_header >> 9) & 0x01
+            channel_mode = (frame_header >> 6) & 0x03
             if first_mpeg_id is None:
                 first_mpeg_id = mpeg_id
-            self.channels = self._CHANNELS_PER_CHANNEL_MODE[channel_mode]
-            frame_bitrate = self._BITRATE_BY_VERSION_BY_LAYER[mpeg_id][layer_id][br_id]
-            self.samplerate = samplerate = self._SAMPLE_RATES[mpeg_id][sr_id]
+            self.channels = channels_per_channel_mode[channel_mode]
+            self.samplerate = samplerate
             frame_length = (144000 * frame_bitrate) // samplerate + padding
             # There might be a xing header in the first frame that contains
             # all the info we need, otherwise parse multiple frames to find the
             # accurate average bitrate
-            if frames == 0 and self._USE_XING_HEADER:
-                walker_offset = walker.tell()
-                frame_content = walker.read(frame_length)
-                xing_header_offset = frame_content.find(b'Xing')
+            if frames == 0 and use_xing_header:
+                xing_header_offset = data.find(b'Xing', pos, pos + frame_length)
                 if xing_header_offset != -1:
-                    walker.seek(walker_offset + xing_header_offset)
-                    xframes, byte_count = self._parse_xing_header(walker)
+                    xframes, byte_count = self._parse_xing_header(data, xing_header_offset)
                     if xframes > 0 and byte_count > 0:
                         # MPEG-2 Audio Layer III uses 576 samples per frame
                         samples_per_frame = 576 if mpeg_id <= 2 else self._SAMPLES_PER_FRAME
                         self.duration = duration = xframes * samples_per_frame / samplerate
                         self.bitrate = byte_count * 8 / duration / 1000
                         return
-                walker.seek(walker_offset)
 
             frames += 1  # it's most probably an mp3 frame
             bitrate_accu += frame_bitrate
             if frames == 1:
-                audio_offset = file_offset + walker.tell()
-            if frames <= self._CBR_DETECTION_FRAME_COUNT:
-                last_bitrates.add(frame_bitrate)
+                audio_offset = file_offset + pos
+                first_bitrate = frame_bitrate
+            elif frames <= cbr_detection_frame_count and frame_bitrate != first_bitrate:
+                is_constant_bitrate = False
 
             frame_size_accu += frame_length
             # if bitrate does not change over time its probably CBR
-            is_cbr = (frames == self._CBR_DETECTION_FRAME_COUNT and len(last_bitrates) == 1)
+            is_cbr = (frames == cbr_detection_frame_count and is_constant_bitrate)
             if frames == max_estimation_frames or is_cbr:
                 # try to estimate duration
                 fh.seek(-128, 2)  # jump to last byte (leaving out id3v1 tag)
@@ -927,7 +991,7 @@ class _ID3(TinyTag):
                 return
 
             if frame_length > 1:  # jump over current frame body
-                walker.seek(frame_length, os.SEEK_CUR)
+                pos += frame_length
         if self.samplerate:
             self.duration = frames * self._SAMPLES_PER_FRAME / self.samplerate
 
@@ -941,7 +1005,8 @@ class _ID3(TinyTag):
         size = major = 0
         extended = False
         # for info on the specs, see: http://id3.org/Developer%20Information
-        header = struct.unpack('3sBBB4B', fh.read(10))
+        header_data = fh.read(10)
+        header = self._ID3V2_HEADER.unpack(header_data)
         tag = header[0].decode('ISO-8859-1', 'replace')
         # check if there is an ID3v2 tag at the beginning of the file
         if tag == 'ID3':
@@ -952,7 +1017,7 @@ class _ID3(TinyTag):
             extended = (header[3] & 0x40) > 0
             # experimental = (header[3] & 0x20) > 0
             # footer = (header[3] & 0x10) > 0
-            size = self._calc_size(header[4:8], 7)
+            size = self._unsynchsafe(header_data[6:10])
         self._bytepos_after_id3v2 = size
         return size, extended, major
 
@@ -962,17 +1027,26 @@ class _ID3(TinyTag):
             end_pos = fh.tell() + size
             parsed_size = 0
             if extended:  # just read over the extended header.
-                size_bytes = struct.unpack('4B', fh.read(6)[0:4])
-                extd_size = self._calc_size(size_bytes, 7)
+                extd_size = self._unsynchsafe(fh.read(6)[0:4])
                 fh.seek(extd_size - 6, os.SEEK_CUR)  # jump over extended_header
+            if major == 2:
+                frame_layout = self._ID3V22_FRAME_LAYOUT
+            elif major == 4:
+                frame_layout = self._ID3V24_FRAME_LAYOUT
+            else:
+                frame_layout = self._ID3V23_FRAME_LAYOUT
             while parsed_size < size:
-                frame_size = self._parse_frame(fh, id3version=major)
+                frame_size = self._parse_frame(fh, frame_layout)
                 if frame_size == 0:
                     break
                 parsed_size += frame_size
             fh.seek(end_pos, os.SEEK_SET)
 
     def _parse_id3v1(self, fh: BinaryIO) -> None:
+        # ID3v2 tags already provided every field ID3v1 could fill in
+        if (self.title and self.artist and self.album and self.year and self.comment
+                and self.genre and self.track is not None):
+            return
         if fh.read(3) != b'TAG':  # check if this is an ID3 v1 tag
             return
 
@@ -997,9 +1071,12 @@ class _ID3(TinyTag):
         if not self.comment:
             self._set_field('comment', asciidecode(comment))
         if not self.genre:
-            genre_id = ord(fields[124:125])
-            if genre_id < len(self._ID3V1_GENRES):
-                self._set_field('genre', self._ID3V1_GENRES[genre_id])
+            try:
+                genre = self._ID3V1_GENRES[ord(fields[124:125])]
+            except IndexError:
+                pass
+            else:
+                self._set_field('genre', genre)
 
     def __parse_custom_field(self, content: str) -> bool:
         custom_field_name, separator, value = content.partition('\x00')
@@ -1012,7 +1089,8 @@ class _ID3(TinyTag):
         return False
 
     @classmethod
-    def _create_tag_image(cls, data: bytes, pic_type: int, mime_type: str | None = None,
+    def _create_tag_image(cls, data: bytes, pic_type: int,
+                          mime_type: str | None = None,
                           description: str | None = None) -> tuple[str, TagImage]:
         field_name = cls._UNKNOWN_IMAGE_TYPE
         if 0 <= pic_type <= len(cls._IMAGE_TYPES):
@@ -1026,140 +1104,172 @@ class _ID3(TinyTag):
 
     @staticmethod
     def _index_utf16(s: bytes, search: bytes) -> int:
-        for i in range(0, len(s), len(search)):
-            if s[i:i + len(search)] == search:
-                return i
-        return -1
-
-    def _parse_frame(self, fh: BinaryIO, id3version: int | None = None) -> int:
-        # ID3v2.2 especially ugly. see: http://id3.org/id3v2-00
-        frame_header_size = 6 if id3version == 2 else 10
-        frame_size_bytes = 3 if id3version == 2 else 4
-        binformat = '3s3B' if id3version == 2 else '4s4B2B'
-        bits_per_byte = 7 if id3version == 4 else 8  # only id3v2.4 is synchsafe
+        step = len(search)
+        i = s.find(search)
+        # only accept matches aligned to the code unit size
+        while i > 0 and i % step:
+            i = s.find(search, i + 1)
+        return i
+
+    def _set_comment_field(self, fieldname: str, value: str) -> None:
+        # check if comment is a key-value pair (used by iTunes)
+        if not self.__parse_custom_field(value):
+            self._set_field(fieldname, value)
+
+    def _set_number_field(self, fieldname: str, value: str) -> None:
+        if '/' in value:
+            value, total = value.split('/')[:2]
+            if total.isdecimal():
+                self._set_field(f'{fieldname}_total', int(total))
+        if value.isdecimal():
+            self._set_field(fieldname, int(value))
+
+    def _set_genre_field(self, fieldname: str, value: str) -> None:
+        genre_id = 255
+        # funky: id3v1 genre hidden in a id3v2 field
+        if value.isdecimal():
+            genre_id = int(value)
+        # funkier: the TCO may contain genres in parens, e.g. '(13)'
+        elif value[:1] == '(':
+            end_pos = value.find(')')
+            parens_text = value[1:end_pos]
+            if end_pos > 0 and parens_text.isdecimal():
+                genre_id = int(parens_text)
+        # genre_id is never negative here
+        try:
+            value = _ID3._ID3V1_GENRES[genre_id]
+        except IndexError:
+            pass
+        self._set_field(fieldname, value)
+
+    # fields which need special treatment before being set
+    _FIELD_HANDLERS: dict[str, Callable[[_ID3, str, str], None]] = {
+        'comment': _set_comment_field,
+        'track': _set_number_field,
+        'disc': _set_number_field,
+        'genre': _set_genre_field,
+    }
+
+    def _parse_frame(self, fh: BinaryIO,
+                     frame_layout: tuple[struct.Struct, int, int] = _ID3V23_FRAME_LAYOUT) -> int:
+        frame_header, frame_size_bytes, bits_per_byte = frame_layout
+        frame_header_size = frame_header.size
         frame_header_data = fh.read(frame_header_size)
         if len(frame_header_data) != frame_header_size:
             return 0
-        frame = struct.unpack(binformat, frame_header_data)
-        frame_id = self._decode_string(frame[0])
-        frame_size = self._calc_size(frame[1:1 + frame_size_bytes], bits_per_byte)
+        frame = frame_header.unpack(frame_header_data)
+        # frame ids are plain ASCII, look them up as bytes and only decode unknown ones
+        frame_id = frame[0].rstrip(b'\x00')
+        if bits_per_byte == 8:  # size directly follows the frame id, which has the same length
+            frame_size = int.from_bytes(
+                frame_header_data[frame_size_bytes:2 * frame_size_bytes], 'big')
+        else:
+            frame_size = self._unsynchsafe(frame_header_data[4:8])
         if DEBUG:
-            print(f'Found id3 Frame {frame_id} at {fh.tell()}-{fh.tell() + frame_size} '
+            print(f'Found id3 Frame {frame_id!r} at {fh.tell()}-{fh.tell() + frame_size} '
                   f'of {self.filesize}')
         if frame_size > 0:
             # flags = frame[1+frame_size_bytes:] # dont care about flags.
-            content = fh.read(frame_size)
             fieldname = self._ID3_MAPPING.get(frame_id)
-            should_set_field = True
+            if fieldname or frame_id in self._CUSTOM_FRAME_IDS:
+                is_wanted = self._parse_tags
+            elif frame_id in self._IMAGE_FRAME_IDS:
+                is_wanted = self._load_image
+            else:
+                is_wanted = self._parse_tags and frame_id not in self._DISALLOWED_FRAME_IDS
+            if not is_wanted:  # jump over the frame without reading (potentially large) content
+                fh.seek(frame_size, os.SEEK_CUR)
+                return frame_size
+            content = fh.read(frame_size)
             if fieldname:
-                if not self._parse_tags:
-                    return frame_size
                 language = fieldname in {'comment', 'extra.lyrics'}
                 value = self._decode_string(content, language)
-                if fieldname == "comment":
-                    # check if comment is a key-value pair (used by iTunes)
-                    should_set_field = not self.__parse_custom_field(value)
-                elif fieldname in {'track', 'disc'}:
-                    if '/' in value:
-                        value, total = value.split('/')[:2]
-                        if total.isdecimal():
-                            self._set_field(f'{fieldname}_total', int(total))
-                    if value.isdecimal():
-                        self._set_field(fieldname, int(value))
-                    should_set_field = False
-                elif fieldname == 'genre':
-                    genre_id = 255
-                    # funky: id3v1 genre hidden in a id3v2 field
-                    if value.isdecimal():
-                        genre_id = int(value)
-                    # funkier: the TCO may contain genres in parens, e.g. '(13)'
-                    elif value[:1] == '(':
-                        end_pos = value.find(')')
-                        parens_text = value[1:end_pos]
-                        if end_pos > 0 and parens_text.isdecimal():
-                            genre_id = int(parens_text)
-                    if 0 <= genre_id < len(_ID3._ID3V1_GENRES):
-                        value = _ID3._ID3V1_GENRES[genre_id]
-                if should_set_field:
+                field_handler = self._FIELD_HANDLERS.get(fieldname)
+                if field_handler is not None:
+                    field_handler(self, fieldname, value)
+                else:
                     self._set_field(fieldname, value)
             elif frame_id in self._CUSTOM_FRAME_IDS:
                 # custom fields
-                if self._parse_tags:
-                    self.__parse_custom_field(self._decode_string(content))
+                self.__parse_custom_field(self._decode_string(content))
             elif frame_id in self._IMAGE_FRAME_IDS:
-                if self._load_image:
-                    # See section 4.14: http://id3.org/id3v2.4.0-frames
-                    encoding = content[0:1]
-                    if frame_id == 'PIC':  # ID3 v2.2:
-                        imgformat = self._decode_string(content[1:4]).lower()
-                        mime_type = self._ID3V2_2_IMAGE_FORMATS.get(imgformat)
-                        desc_start_pos = 1 + 3 + 1  # skip encoding (1), imgformat (3), pictype(1)
-                    else:  # ID3 v2.3+
-                        mime_type_end_pos = content.index(b'\x00', 1)
-                        mime_type = self._decode_string(content[1:mime_type_end_pos]).lower()
-                        if mime_type in self._ID3V2_2_IMAGE_FORMATS:  # ID3 v2.2 format in v2.3...
-                            mime_type = self._ID3V2_2_IMAGE_FORMATS[mime_type]
-                        desc_start_pos = mime_type_end_pos + 1 + 1  # skip mtype, pictype(1)
-                    pic_type = content[desc_start_pos - 1]
-                    # latin1 and utf-8 are 1 byte
-                    termination = b'\x00' if encoding in {b'\x00', b'\x03'} else b'\x00\x00'
-                    desc_length = self._index_utf16(content[desc_start_pos:], termination)
-                    desc_end_pos = desc_start_pos + desc_length + len(termination)
-                    description = self._decode_string(content[desc_start_pos:desc_end_pos])
-                    field_name, image = self._create_tag_image(
-                        content[desc_end_pos:], pic_type, mime_type, description)
-                    self._set_image_field(field_name, image)
-            elif frame_id not in self._DISALLOWED_FRAME_IDS:
+                # See section 4.14: http://id3.org/id3v2.4.0-frames
+                encoding = content[0:1]
+                if frame_id == b'PIC':  # ID3 v2.2:
+                    imgformat = self._decode_string(content[1:4]).lower()
+                    mime_type = self._ID3V2_2_IMAGE_FORMATS.get(imgformat)
+                    desc_start_pos = 1 + 3 + 1  # skip encoding (1), imgformat (3), pictype(1)
+                else:  # ID3 v2.3+
+                    mime_type_end_pos = content.index(b'\x00', 1)
+                    mime_type = self._decode_string(content[1:mime_type_end_pos]).lower()
+                    if mime_type in self._ID3V2_2_IMAGE_FORMATS:  # ID3 v2.2 format in v2.3...
+                        mime_type = self._ID3V2_2_IMAGE_FORMATS[mime_type]
+                    desc_start_pos = mime_type_end_pos + 1 + 1  # skip mtype, pictype(1)
+                pic_type = content[desc_start_pos - 1]
+                # latin1 and utf-8 are 1 byte
+                termination = b'\x00' if encoding in {b'\x00', b'\x03'} else b'\x00\x00'
+                desc_length = self._index_utf16(content[desc_start_pos:], termination)
+                desc_end_pos = desc_start_pos + desc_length + len(termination)
+                description = self._decode_string(content[desc_start_pos:desc_end_pos])
+                field_name, image = self._create_tag_image(
+                    content[desc_end_pos:], pic_type, mime_type, description)
+                self._set_image_field(field_name, image)
+            else:
                 # unknown, try to add to extra dict
-                if self._parse_tags:
-                    self._set_field(
-                        self._EXTRA_PREFIX + frame_id.lower(), self._decode_string(content))
+                self._set_field(
+                    self._EXTRA_PREFIX + frame_id.decode('ISO-8859-1').lower(),
+                    self._decode_string(content))
             return frame_size
         return 0
 
     def _decode_string(self, bytestr: bytes, language: bool = False) -> str:
-        default_encoding = 'ISO-8859-1'
-        if self._default_encoding:
-            default_encoding = self._default_encoding
         # it's not my fault, this is the spec.
+        # only track the start/end offsets of the text, and slice once at the end
         first_byte = bytestr[:1]
+        start = 1
+        end = len(bytestr)
         if first_byte == b'\x00':  # ISO-8859-1
-            bytestr = bytestr[1:]
-            encoding = default_encoding
+            encoding = self._default_encoding or 'ISO-8859-1'
         elif first_byte == b'\x01':  # UTF-16 with BOM
-            bytestr = bytestr[1:]
+            boms = self._UTF16_BOMS
             # remove language (but leave BOM)
             if language:
-                if bytestr[3:5] in {b'\xfe\xff', b'\xff\xfe'}:
-                    bytestr = bytestr[3:]
-                if bytestr[:3].isalpha():
-                    bytestr = bytestr[3:]  # remove language
-                bytestr = bytestr.lstrip(b'\x00')  # strip optional additional null bytes
+                if bytestr[start + 3:start + 5] in boms:
+                    start += 3
+                if bytestr[start:start + 3].isalpha():
+                    start += 3  # remove language
+                while start < end and bytestr[start] == 0:
+                    start += 1  # strip optional additional null bytes
             # read byte order mark to determine endianness
-            encoding = 'UTF-16be' if bytestr[0:2] == b'\xfe\xff' else 'UTF-16le'
+            bom = bytestr[start:start + 2]
+            encoding = 'UTF-16be' if bom == b'\xfe\xff' else 'UTF-16le'
             # strip the bom if it exists
-            if bytestr[:2] in {b'\xfe\xff', b'\xff\xfe'}:
-                bytestr = bytestr[2:] if len(bytestr) % 2 == 0 else bytestr[2:-1]
+            if bom in boms:
+                if (end - start) % 2:
+                    end -= 1
+                start += 2
             # remove ADDITIONAL EXTRA BOM :facepalm:
-            if bytestr[:4] == b'\x00\x00\xff\xfe':
-                bytestr = bytestr[4:]
+            if bytestr.startswith(b'\x00\x00\xff\xfe', start, end):
+                start += 4
         elif first_byte == b'\x02':  # UTF-16LE
             # strip optional null byte, if byte count uneven
-            bytestr = bytestr[1:-1] if len(bytestr) % 2 == 0 else bytestr[1:]
+            if end % 2 == 0:
+                end -= 1
             encoding = 'UTF-16le'
         elif first_byte == b'\x03':  # UTF-8
-            bytestr = bytestr[1:]
             encoding = 'UTF-8'
         else:
-            encoding = default_encoding  # wild guess
-        if language and bytestr[:3].isalpha():
-            bytestr = bytestr[3:]  # remove language
-        return self._unpad(bytestr.decode(encoding, 'replace'))
+            start = 0
+            encoding = self._default_encoding or 'ISO-8859-1'  # wild guess
+        if language and bytestr[start:min(start + 3, end)].isalpha():
+            start += 3  # remove language
+        return self._unpad(bytestr[start:end].decode(encoding, 'replace'))
 
     @staticmethod
-    def _calc_size(bytestr: tuple[int, ...], bits_per_byte: int) -> int:
-        # length of some mp3 header fields is described by 7 or 8-bit-bytes
-        return reduce(lambda accu, elem: (accu << bits_per_byte) + elem, bytestr, 0)
+    def _unsynchsafe(bytestr: bytes) -> int:
+        # length of some mp3 header fields is described by four 7-bit-bytes,
+        # high bits are not masked, some taggers write plain integers in v2.4
+        return (bytestr[0] << 21) + (bytestr[1] << 14) + (bytestr[2] << 7) + bytestr[3]
 
 
 class _Ogg(TinyTag):
@@ -1206,6 +1316,12 @@ class _Ogg(TinyTag):
         'catalognumber': 'extra.catalog_number',
     }
 
+    _VORBIS_HEADER = struct.Struct('<B4i')
+    _OPUS_HEADER = struct.Struct('<BBHIHB')
+    _SPEEX_HEADER = struct.Struct('<5i')
+    _UINT32_LE = struct.Struct('<I')
+    _PAGE_HEADER = struct.Struct('<4sBBqIIiB')
+
     def __init__(self) -> None:
         super().__init__()
         self._max_samplenum = 0  # maximum sample position ever read
@@ -1238,31 +1354,29 @@ class _Ogg(TinyTag):
         check_flac_second_packet = False
         check_speex_second_packet = False
         for packet in self._parse_pages(fh):
-            walker = io.BytesIO(packet)
-            if packet[0:7] == b"\x01vorbis":
+            if packet.startswith(b"\x01vorbis"):
                 if self._parse_duration:
                     (self.channels, self.samplerate, _max_bitrate, bitrate,
-                     _min_bitrate) = struct.unpack("<B4i", packet[11:28])
+                     _min_bitrate) = self._VORBIS_HEADER.unpack_from(packet, 11)
                     self.bitrate = bitrate / 1000
-            elif packet[0:7] == b"\x03vorbis":
+            elif packet.startswith(b"\x03vorbis"):
                 if self._parse_tags:
-                    walker.seek(7, os.SEEK_CUR)  # jump over header name
-                    self._parse_vorbis_comment(walker)
-            elif packet[0:8] == b'OpusHead':
+                    self._parse_vorbis_comment(packet, 7)  # jump over header name
+            elif packet.startswith(b'OpusHead'):
                 if self._parse_duration:  # parse opus header
                     # https://www.videolan.org/developers/vlc/modules/codec/opus_header.c
                     # https://mf4.xiph.org/jenkins/view/opus/job/opusfile-unix/ws/doc/html/structOpusHead.html
-                    walker.seek(8, os.SEEK_CUR)  # jump over header name
-                    (version, ch, _, _sr, _, _) = struct.unpack("<BBHIHB", walker.read(11))
+                    # fields follow the 8 byte header name
+                    (version, ch, _, _sr, _, _) = self._OPUS_HEADER.unpack_from(packet, 8)
                     if (version & 0xF0) == 0:  # only major version 0 supported
                         self.channels = ch
                         self.samplerate = 48000  # internally opus always uses 48khz
-            elif packet[0:8] == b'OpusTags':
+            elif packet.startswith(b'OpusTags'):
                 if self._parse_tags:  # parse opus metadata:
-                    walker.seek(8, os.SEEK_CUR)  # jump over header name
-                    self._parse_vorbis_comment(walker)
-            elif packet[0:5] == b'\x7fFLAC':
+                    self._parse_vorbis_comment(packet, 8)  # jump over header name
+            elif packet.startswith(b'\x7fFLAC'):
                 # https://xiph.org/flac/ogg_mapping.html
+                walker = io.BytesIO(packet)
                 walker.seek(9, os.SEEK_CUR)  # jump over header name, version and number of headers
                 flactag = _Flac()
                 flactag._filehandler = walker
@@ -1274,24 +1388,24 @@ class _Ogg(TinyTag):
             elif check_flac_second_packet:
                 # second packet contains FLAC metadata block
                 if self._parse_tags:
-                    meta_header = struct.unpack('B3B', walker.read(4))
-                    block_type = meta_header[0] & 0x7f
+                    block_type = packet[0] & 0x7f
                     if block_type == _Flac.METADATA_VORBIS_COMMENT:
-                        self._parse_vorbis_comment(walker)
+                        self._parse_vorbis_comment(packet, 4)  # jump over metadata block header
                 check_flac_second_packet = False
-            elif packet[0:8] == b'Speex   ':
+            elif packet.startswith(b'Speex   '):
                 # https://speex.org/docs/manual/speex-manual/node8.html
                 if self._parse_duration:
-                    walker.seek(36, os.SEEK_CUR)  # jump over header name and irrelevant fields
+                    # fields of interest follow the header name and irrelevant fields
                     (self.samplerate, _, _, self.channels,
-                     self.bitrate) = struct.unpack("<5i", walker.read(20))
+                     self.bitrate) = self._SPEEX_HEADER.unpack_from(packet, 36)
                 check_speex_second_packet = True
             elif check_speex_second_packet:
                 if self._parse_tags:
-                    length = struct.unpack('I', walker.read(4))[0]  # starts with a comment string
-                    comment = walker.read(length).decode('utf-8', 'replace')
+                    length = self._UINT32_LE.unpack_from(packet)[0]  # starts with a comment string
+                    comment = packet[4:4 + length].decode('utf-8', 'replace')
                     self._set_field('comment', comment)
-                    self._parse_vorbis_comment(walker, contains_vendor=False)  # other tags
+                    # other tags
+                    self._parse_vorbis_comment(packet, 4 + length, contains_vendor=False)
                 check_speex_second_packet = False
             else:
                 if DEBUG:
@@ -1299,67 +1413,86 @@ class _Ogg(TinyTag):
                 break
         self._tags_parsed = True
 
-    def _parse_vorbis_comment(self, fh: BinaryIO, contains_vendor: bool = True) -> None:
+    def _parse_vorbis_comment(self, data: bytes, pos: int = 0,
+                              contains_vendor: bool = True) -> int:
         # for the spec, see: http://xiph.org/vorbis/doc/v-comment.html
         # discnumber tag based on: https://en.wikipedia.org/wiki/Vorbis_comment
         # https://sno.phy.queensu.ca/~phil/exiftool/TagNames/Vorbis.html
+        # returns the position after the last comment
+        unpack_length = self._UINT32_LE.unpack_from
+        vorbis_mapping = self._VORBIS_MAPPING
+        extra_prefix = self._EXTRA_PREFIX
+        set_field = self._set_field
+        debug = DEBUG
         if contains_vendor:
-            vendor_length = struct.unpack('I', fh.read(4))[0]
-            fh.seek(vendor_length, os.SEEK_CUR)  # jump over vendor
-        elements = struct.unpack('I', fh.read(4))[0]
+            vendor_length = unpack_length(data, pos)[0]
+            pos += 4 + vendor_length  # jump over vendor
+        elements = unpack_length(data, pos)[0]
+        pos += 4
         for _i in range(elements):
-            length = struct.unpack('I', fh.read(4))[0]
-            keyvalpair = fh.read(length).decode('utf-8', 'replace')
-            if '=' in keyvalpair:
-                key, value = keyvalpair.split('=', 1)
+            length = unpack_length(data, pos)[0]
+            pos += 4
+            key_data, separator, value_data = data[pos:pos + length].partition(b'=')
+            pos += length
+            if separator:
+                key = key_data.decode('utf-8', 'replace')
                 key_lowercase = key.lower()
-
-                if key_lowercase == "metadata_block_picture" and self._load_image:
-                    if DEBUG:
-                        print('Found Vorbis TagImage', key, value[:64])
-                    fieldname, fieldvalue = _Flac._parse_image(io.BytesIO(base64.b64decode(value)))
-                    self._set_image_field(fieldname, fieldvalue)
+                if key_lowercase == "metadata_block_picture":
+                    # don't decode (potentially large) image data unless requested
+                    if self._load_image:
+                        if debug:
+                            print('Found Vorbis TagImage', key, value_data[:64])
+                        fieldname, fieldvalue = _Flac._parse_image(
+                            io.BytesIO(base64.b64decode(value_data)))
+                        self._set_image_field(fieldname, fieldvalue)
                 else:
-                    if DEBUG:
+                    value = value_data.decode('utf-8', 'replace')
+                    if debug:
                         print('Found Vorbis Comment', key, value[:64])
-                    fieldname = self._VORBIS_MAPPING.get(
-                        key_lowercase, self._EXTRA_PREFIX + key_lowercase)  # custom field
+                    fieldname = vorbis_mapping.get(
+                        key_lowercase, extra_prefix + key_lowercase)  # custom field
                     if fieldname in {'track', 'disc', 'track_total', 'disc_total'}:
                         if fieldname in {'track', 'disc'} and '/' in value:
                             value, total = value.split('/')[:2]
                             if total.isdecimal():
-                                self._set_field(f'{fieldname}_total', int(total))
+                                set_field(f'{fieldname}_total', int(total))
                         if value.isdecimal():
-                            self._set_field(fieldname, int(value))
+                            set_field(fieldname, int(value))
                     else:
-                        self._set_field(fieldname, value)
+                        set_field(fieldname, value)
+        return pos
 
     def _parse_pages(self, fh: BinaryIO) -> Iterator[bytes]:
         # for the spec, see: https://wiki.xiph.org/Ogg
-        previous_page = b''  # contains data from previous (continuing) pages
-        header_data = fh.read(27)  # read ogg page header
+        previous_page = bytearray()  # contains data from previous (continuing) pages
+        unpack_header = self._PAGE_HEADER.unpack
+        read = fh.read
+        header_data = read(27)  # read ogg page header
         while len(header_data) == 27:
-            header = struct.unpack('<4sBBqIIiB', header_data)
             # https://xiph.org/ogg/doc/framing.html
-            oggs, version, _flags, pos, _serial, _pageseq, _crc, segments = header
+            oggs, version, _flags, pos, _serial, _pageseq, _crc, segments = unpack_header(
+                header_data)
             self._max_samplenum = max(self._max_samplenum, pos)
             if oggs != b'OggS' or version != 0:
                 raise ParseError('Invalid OGG header')
-            segsizes = struct.unpack('B' * segments, fh.read(segments))
+            segsizes = read(segments)  # iterating bytes yields the segment sizes as ints
+            page = memoryview(read(sum(segsizes)))  # read all segments at once
+            packet_start = 0
             total = 0
-            for segsize in segsizes:  # read all segments
+            for segsize in segsizes:
                 total += segsize
                 if total < 255:  # less than 255 bytes means end of page
-                    yield previous_page + fh.read(total)
-                    previous_page = b''
+                    previous_page += page[packet_start:packet_start + total]
+                    yield bytes(previous_page)
+                    previous_page.clear()
+                    packet_start += total
                     total = 0
             if total != 0:
-                if total % 255 == 0:
-                    previous_page += fh.read(total)
-                else:
-                    yield previous_page + fh.read(total)
-                    previous_page = b''
-            header_data = fh.read(27)
+                previous_page += page[packet_start:]
+                if total % 255 != 0:
+                    yield bytes(previous_page)
+                    previous_page.clear()
+            header_data = read(27)
 
 
 class _Wave(TinyTag):
@@ -1387,66 +1520,93 @@ class _Wave(TinyTag):
         b'IENC': 'extra.encoded_by',
         b'IMED': 'extra.media',
     }
+    _RIFF_HEADER = struct.Struct('<4sI4s')
+    _CHUNK_HEADER = struct.Struct('<4sI')
+    _FMT_CHUNK = struct.Struct('<HHIIHH')
 
     def _determine_duration(self, fh: BinaryIO) -> None:
         if not self._tags_parsed:
             self._parse_tag(fh)
 
+    def _parse_fmt_chunk(self, fh: BinaryIO, size: int) -> None:
+        _, channels, samplerate, _, _, bitdepth = self._FMT_CHUNK.unpack(fh.read(16))
+        if bitdepth == 0:
+            # Certain codecs (e.g. GSM 6.10) give us a bit depth of zero.
+            # Avoid division by zero when calculating duration.
+            bitdepth = 1
+        self.bitrate = samplerate * channels * bitdepth / 1000
+        self.channels, self.samplerate, self.bitdepth = channels, samplerate, bitdepth
+        remaining_size = size - 16
+        if remaining_size > 0:
+            fh.seek(remaining_size, 1)  # skip remaining data in chunk
+
+    def _parse_data_chunk(self, fh: BinaryIO, size: int) -> None:
+        if (self.channels is not None and self.samplerate is not None
+                and self.bitdepth is not None):
+            self.duration = size / self.channels / self.samplerate / (self.bitdepth / 8)
+        fh.seek(size, 1)
+
+    def _parse_list_chunk(self, fh: BinaryIO, size: int) -> None:
+        is_info = fh.read(4)  # check INFO header
+        if is_info != b'INFO':  # jump over non-INFO sections
+            fh.seek(size - 4, os.SEEK_CUR)
+            return
+        unpack_chunk_header = self._CHUNK_HEADER.unpack_from
+        riff_mapping = self._RIFF_MAPPING
+        info = fh.read(size - 4)
+        info_size = len(info)
+        pos = 0
+        while info_size - pos >= 4:
+            field, data_length = unpack_chunk_header(info, pos)
+            data_length += data_length % 2  # IFF chunks are padded to an even size
+            pos += 8
+            data = info[pos:pos + data_length].split(b'\x00', 1)[0]  # strip zero-byte
+            pos += data_length
+            fieldname = riff_mapping.get(field)
+            if fieldname:
+                value = data.decode('utf-8', 'replace')
+                if fieldname == 'track':
+                    if value.isdecimal():
+                        self._set_field(fieldname, int(value))
+                else:
+                    self._set_field(fieldname, value)
+
+    def _parse_id3_chunk(self, fh: BinaryIO, _size: int) -> None:
+        id3 = _ID3()
+        id3._filehandler = fh
+        id3._load(tags=True, duration=False, image=self._load_image)
+        self._update(id3)
+
+    _TAG_CHUNK_HANDLERS: dict[bytes, Callable[[_Wave, BinaryIO, int], None]] = {
+        b'LIST': _parse_list_chunk,
+        b'id3 ': _parse_id3_chunk,
+        b'ID3 ': _parse_id3_chunk,
+    }
+    _DURATION_CHUNK_HANDLERS: dict[bytes, Callable[[_Wave, BinaryIO, int], None]] = {
+        b'fmt ': _parse_fmt_chunk,
+        b'data': _parse_data_chunk,
+    }
+
     def _parse_tag(self, fh: BinaryIO) -> None:
         # see: http://www-mmsp.ece.mcgill.ca/Documents/AudioFormats/WAVE/WAVE.html
         # and: https://en.wikipedia.org/wiki/WAV
-        riff, _size, fformat = struct.unpack('4sI4s', fh.read(12))
+        riff, _size, fformat = self._RIFF_HEADER.unpack(fh.read(12))
         if riff != b'RIFF' or fformat != b'WAVE':
             raise ParseError('Invalid WAV header')
+        chunk_handlers: dict[bytes, Callable[[_Wave, BinaryIO, int], None]] = {}
+        if self._parse_tags:
+            chunk_handlers.update(self._TAG_CHUNK_HANDLERS)
         if self._parse_duration:
             self.bitdepth = 16  # assume 16bit depth (CD quality)
+            chunk_handlers.update(self._DURATION_CHUNK_HANDLERS)
+        unpack_chunk_header = self._CHUNK_HEADER.unpack
         chunk_header = fh.read(8)
         while len(chunk_header) == 8:
-            subchunkid, subchunksize = struct.unpack('4sI', chunk_header)
+            subchunkid, subchunksize = unpack_chunk_header(chunk_header)
             subchunksize += subchunksize % 2  # IFF chunks are padded to an even number of bytes
-            if subchunkid == b'fmt ' and self._parse_duration:
-                _, channels, samplerate = struct.unpack('HHI', fh.read(8))
-                _, _, bitdepth = struct.unpack('<IHH', fh.read(8))
-                if bitdepth == 0:
-                    # Certain codecs (e.g. GSM 6.10) give us a bit depth of zero.
-                    # Avoid division by zero when calculating duration.
-                    bitdepth = 1
-                self.bitrate = samplerate * channels * bitdepth / 1000
-                self.channels, self.samplerate, self.bitdepth = channels, samplerate, bitdepth
-                remaining_size = subchunksize - 16
-                if remaining_size > 0:
-                    fh.seek(remaining_size, 1)  # skip remaining data in chunk
-            elif subchunkid == b'data' and self._parse_duration:
-                if (self.channels is not None and self.samplerate is not None
-                        and self.bitdepth is not None):
-                    self.duration = (
-                        subchunksize / self.channels / self.samplerate / (self.bitdepth / 8))
-                fh.seek(subchunksize, 1)
-            elif subchunkid == b'LIST' and self._parse_tags:
-                is_info = fh.read(4)  # check INFO header
-                if is_info != b'INFO':  # jump over non-INFO sections
-                    fh.seek(subchunksize - 4, os.SEEK_CUR)
-                else:
-                    sub_fh = io.BytesIO(fh.read(subchunksize - 4))
-                    field = sub_fh.read(4)
-                    while len(field) == 4:
-                        data_length = struct.unpack('I', sub_fh.read(4))[0]
-                        data_length += data_length % 2  # IFF chunks are padded to an even size
-                        data = sub_fh.read(data_length).split(b'\x00', 1)[0]  # strip zero-byte
-                        fieldname = self._RIFF_MAPPING.get(field)
-                        if fieldname:
-                            value = data.decode('utf-8', 'replace')
-                            if fieldname == 'track':
-                                if value.isdecimal():
-                                    self._set_field(fieldname, int(value))
-                            else:
-                                self._set_field(fieldname, value)
-                        field = sub_fh.read(4)
-            elif subchunkid in {b'id3 ', b'ID3 '} and self._parse_tags:
-                id3 = _ID3()
-                id3._filehandler = fh
-                id3._load(tags=True, duration=False, image=self._load_image)
-                self._update(id3)
+            chunk_handler = chunk_handlers.get(subchunkid)
+            if chunk_handler is not None:
+                chunk_handler(self, fh, subchunksize)
             else:  # some other chunk, just skip the data
                 fh.seek(subchunksize, 1)
             chunk_header = fh.read(8)
@@ -1461,6 +1621,8 @@ class _Flac(TinyTag):
     METADATA_VORBIS_COMMENT = 4
     METADATA_CUESHEET = 5
     METADATA_PICTURE = 6
+    _UINT32 = struct.Struct('>I')
+    _UINT32_X2 = struct.Struct('>2I')
 
     def _determine_duration(self, fh: BinaryIO) -> None:
         if not self._tags_parsed:
@@ -1482,50 +1644,60 @@ class _Flac(TinyTag):
         # for spec, see https://xiph.org/flac/ogg_mapping.html
         header_data = fh.read(4)
         while len(header_data) == 4:
-            meta_header = struct.unpack('B3B', header_data)
-            block_type = meta_header[0] & 0x7f
-            is_last_block = meta_header[0] & 0x80
-            size = self._bytes_to_int(meta_header[1:4])
+            block_type = header_data[0] & 0x7f
+            is_last_block = header_data[0] & 0x80
+            size = int.from_bytes(header_data[1:4], 'big')
             # http://xiph.org/flac/format.html#metadata_block_streaminfo
             if block_type == self.METADATA_STREAMINFO and self._parse_duration:
                 stream_info_header = fh.read(size)
                 if len(stream_info_header) < 34:  # invalid streaminfo
                     break
-                header_values = struct.unpack('HH3s3s8B16s', stream_info_header)
                 # From the xiph documentation:
-                # py | <bits>
+                # <bits>
                 # ----------------------------------------------
-                # H  | <16>  The minimum block size (in samples)
-                # H  | <16>  The maximum block size (in samples)
-                # 3s | <24>  The minimum frame size (in bytes)
-                # 3s | <24>  The maximum frame size (in bytes)
-                # 8B | <20>  Sample rate in Hz.
-                #    | <3>   (number of channels)-1.
-                #    | <5>   (bits per sample)-1.
-                #    | <36>  Total samples in stream.
-                # 16s| <128> MD5 signature
-                # min_blk, max_blk, min_frm, max_frm = header[0:4]
-                # min_frm = self._bytes_to_int(struct.unpack('3B', min_frm))
-                # max_frm = self._bytes_to_int(struct.unpack('3B', max_frm))
+                # <16>  The minimum block size (in samples)
+                # <16>  The maximum block size (in samples)
+                # <24>  The minimum frame size (in bytes)
+                # <24>  The maximum frame size (in bytes)
+                # <20>  Sample rate in Hz.
+                # <3>   (number of channels)-1.
+                # <5>   (bits per sample)-1.
+                # <36>  Total samples in stream.
+                # <128> MD5 signature
+                # the 64 bits starting at byte 10 hold the fields we need:
                 #                 channels--.  bits      total samples
                 # |----- samplerate -----| |-||----| |---------~   ~----|
                 # 0000 0000 0000 0000 0000 0000 0000 0000 0000      0000
-                # #---4---# #---5---# #---6---# #---7---# #--8-~   ~-12-#
-                self.samplerate = self._bytes_to_int(header_values[4:7]) >> 4
-                self.channels = ((header_values[6] >> 1) & 0x07) + 1
-                self.bitdepth = (
-                    ((header_values[6] & 1) << 4) + ((header_values[7] & 0xF0) >> 4) + 1)
-                total_sample_bytes = ((header_values[7] & 0x0F),) + header_values[8:12]
-                total_samples = self._bytes_to_int(total_sample_bytes)
+                # #---10--# #---11--# #---12--# #---13--# #--14-~   ~-17-#
+                stream_info = int.from_bytes(stream_info_header[10:18], 'big')
+                self.samplerate = stream_info >> 44
+                self.channels = ((stream_info >> 41) & 0x07) + 1
+                self.bitdepth = ((stream_info >> 36) & 0x1F) + 1
+                total_samples = stream_info & 0xFFFFFFFFF
                 self.duration = total_samples / self.samplerate
                 if self.duration > 0:
                     self.bitrate = self.filesize / self.duration * 8 / 1000
+                if not self._parse_tags and not self._load_image:
+                    break  # no need to walk the remaining blocks
             elif block_type == self.METADATA_VORBIS_COMMENT and self._parse_tags:
+                block_start = fh.tell()
+                data = fh.read(size)
                 oggtag = _Ogg()
                 oggtag._filehandler = fh
-                oggtag._parse_vorbis_comment(fh)
+                try:
+                    end_pos = oggtag._parse_vorbis_comment(data)
+                except struct.error:
+                    end_pos = -1
+                if not 0 <= end_pos <= len(data):
+                    # declared block size is too short for the comments, read them from the file
+                    fh.seek(block_start)
+                    oggtag = _Ogg()
+                    oggtag._filehandler = fh
+                    end_pos = oggtag._parse_vorbis_comment(fh.read())
+                    fh.seek(block_start + end_pos)
                 self._update(oggtag)
             elif block_type == self.METADATA_PICTURE and self._load_image:
+                # the declared block size may be too short, read the picture fields from the file
                 fieldname, value = self._parse_image(fh)
                 self._set_image_field(fieldname, value)
             elif block_type >= 127:
@@ -1545,11 +1717,14 @@ class _Flac(TinyTag):
     @classmethod
     def _parse_image(cls, fh: BinaryIO) -> tuple[str, TagImage]:
         # https://xiph.org/flac/format.html#metadata_block_picture
-        pic_type, mime_type_len = struct.unpack('>2I', fh.read(8))
-        mime_type = fh.read(mime_type_len).decode('utf-8', 'replace')
-        description_len = struct.unpack('>I', fh.read(4))[0]
-        description = fh.read(description_len).decode('utf-8', 'replace')
-        _width, _height, _depth, _colors, pic_len = struct.unpack('>5I', fh.read(20))
+        unpack_uint32 = cls._UINT32.unpack_from
+        pic_type, mime_type_len = cls._UINT32_X2.unpack(fh.read(8))
+        data = fh.read(mime_type_len + 4)  # mime type and description length
+        mime_type = data[:mime_type_len].decode('utf-8', 'replace')
+        description_len = unpack_uint32(data, mime_type_len)[0]
+        data = fh.read(description_len + 20)  # description, width, height, depth, colors, length
+        description = data[:description_len].decode('utf-8', 'replace')
+        pic_len = unpack_uint32(data, description_len + 16)[0]
         return _ID3._create_tag_image(fh.read(pic_len), pic_type, mime_type, description)
 
 
@@ -1593,6 +1768,15 @@ class _Wma(TinyTag):
     _ASF_FILE_PROPERTY_OBJECT = b'\xa1\xdc\xab\x8cG\xa9\xcf\x11\x8e\xe4\x00\xc0\x0c Se'
     _ASF_STREAM_PROPERTIES_OBJECT = b'\x91\x07\xdc\xb7\xb7\xa9\xcf\x11\x8e\xe6\x00\xc0\x0c Se'
     _STREAM_TYPE_ASF_AUDIO_MEDIA = b'@\x9ei\xf8M[\xcf\x11\xa8\xfd\x00\x80_\\D+'
+    _OBJECT_HEADER = struct.Struct('<16sQ')
+    _FILE_PROPERTIES = struct.Struct('<40xQ8xQ16x')
+    _STREAM_PROPERTIES = struct.Struct('<16s24xII6x')
+    _AUDIO_MEDIA_FORMAT = struct.Struct('<HHII2xH')
+    _CONTENT_DESCRIPTION_LENGTHS = struct.Struct('<5H')
+    _UINT16_LE = struct.Struct('<H')
+    _DESCRIPTOR_VALUE_HEADER = struct.Struct('<HH')
+    # field names for the strings in a content description object, rating is not used
+    _CONTENT_DESCRIPTION_FIELDS = ('title', 'artist', 'extra.copyright', 'comment', None)
 
     def _determine_duration(self, fh: BinaryIO) -> None:
         if not self._tags_parsed:
@@ -1609,6 +1793,91 @@ class _Wma(TinyTag):
             return self._bytes_to_int_le(value)
         return None
 
+    def _parse_content_description(self, fh: BinaryIO, _size: int) -> None:
+        lengths = self._CONTENT_DESCRIPTION_LENGTHS.unpack(fh.read(10))
+        data = fh.read(sum(lengths))
+        pos = 0
+        for field_name, length in zip(self._CONTENT_DESCRIPTION_FIELDS, lengths):
+            if field_name:
+                self._set_field(field_name, self._decode_string(data[pos:pos + length]))
+            pos += length
+
+    def _parse_extended_content_description(self, fh: BinaryIO, size: int) -> None:
+        # http://web.archive.org/web/20131203084402/http://msdn.microsoft.com/en-us/library/bb643323.aspx#_Toc509555195
+        unpack_uint16 = self._UINT16_LE.unpack_from
+        unpack_value_header = self._DESCRIPTOR_VALUE_HEADER.unpack_from
+        decode_string = self._decode_string
+        asf_mapping = self._ASF_MAPPING
+        extra_prefix = self._EXTRA_PREFIX
+        set_field = self._set_field
+        data = fh.read(size)  # read all descriptors at once
+        data_size = len(data)
+        if data_size < 2:
+            return
+        descriptor_count = unpack_uint16(data)[0]
+        pos = 2
+        for _ in range(descriptor_count):
+            if data_size - pos < 2:
+                break  # truncated object
+            name_len = unpack_uint16(data, pos)[0]
+            pos += 2
+            name = decode_string(data[pos:pos + name_len])
+            pos += name_len
+            if data_size - pos < 4:
+                break  # truncated object
+            value_type, value_len = unpack_value_header(data, pos)
+            pos += 4
+            value_pos = pos
+            pos += value_len
+            if value_type == 1:
+                continue  # skip byte values
+            field_name = asf_mapping.get(name)  # try to get normalized field name
+            if field_name is None:  # custom field
+                if name.startswith('WM/'):
+                    name = name[3:]
+                field_name = extra_prefix + name.lower()
+            field_value = self._decode_ext_desc(value_type, data[value_pos:pos])
+            if field_value is not None:
+                if field_name in {'track', 'disc'}:
+                    if isinstance(field_value, int) or field_value.isdecimal():
+                        set_field(field_name, int(field_value))
+                else:
+                    set_field(field_name, field_value)
+
+    def _parse_file_properties(self, fh: BinaryIO, _size: int) -> None:
+        play_duration, preroll = self._FILE_PROPERTIES.unpack(
+            fh.read(self._FILE_PROPERTIES.size))
+        # According to the specification, we need to subtract the preroll from play_duration
+        # to get the actual duration of the file
+        self.duration = max(play_duration / 10000000 - preroll / 1000, 0.0)
+
+    def _parse_stream_properties(self, fh: BinaryIO, _size: int) -> None:
+        # irrelevant fields are skipped by the struct format
+        (stream_type, type_specific_data_length,
+         error_correction_data_length) = self._STREAM_PROPERTIES.unpack(
+            fh.read(self._STREAM_PROPERTIES.size))
+        already_read = 0
+        if stream_type == self._STREAM_TYPE_ASF_AUDIO_MEDIA:
+            (codec_id_format_tag, self.channels, self.samplerate, avg_bytes_per_second,
+             bits_per_sample) = self._AUDIO_MEDIA_FORMAT.unpack(
+                fh.read(self._AUDIO_MEDIA_FORMAT.size))
+            self.bitrate = avg_bytes_per_second * 8 / 1000
+            if codec_id_format_tag == 355:  # lossless
+                self.bitdepth = bits_per_sample
+            already_read = 16
+        fh.seek(type_specific_data_length - already_read, os.SEEK_CUR)
+        fh.seek(error_correction_data_length, os.SEEK_CUR)
+
+    # header objects we parse, depending on whether tags or duration were requested
+    _TAG_OBJECT_HANDLERS: dict[bytes, Callable[[_Wma, BinaryIO, int], None]] = {
+        _ASF_CONTENT_DESCRIPTION_OBJECT: _parse_content_description,
+        _ASF_EXTENDED_CONTENT_DESCRIPTION_OBJECT: _parse_extended_content_description,
+    }
+    _DURATION_OBJECT_HANDLERS: dict[bytes, Callable[[_Wma, BinaryIO, int], None]] = {
+        _ASF_FILE_PROPERTY_OBJECT: _parse_file_properties,
+        _ASF_STREAM_PROPERTIES_OBJECT: _parse_stream_properties,
+    }
+
     def _parse_tag(self, fh: BinaryIO) -> None:
         header = fh.read(30)
         # http://www.garykessler.net/library/file_sigs.html
@@ -1616,80 +1885,27 @@ class _Wma(TinyTag):
         if (header[:16] != b'0&\xb2u\x8ef\xcf\x11\xa6\xd9\x00\xaa\x00b\xcel'  # 128 bit GUID
                 or header[-1:] != b'\x02'):
             raise ParseError('Invalid WMA header')
+        object_handlers: dict[bytes, Callable[[_Wma, BinaryIO, int], None]] = {}
+        if self._parse_tags:
+            object_handlers.update(self._TAG_OBJECT_HANDLERS)
+        if self._parse_duration:
+            object_handlers.update(self._DURATION_OBJECT_HANDLERS)
+        unpack_object_header = self._OBJECT_HEADER.unpack
         while True:
-            object_id = fh.read(16)
-            object_size = self._bytes_to_int_le(fh.read(8))
+            object_header = fh.read(24)
+            if len(object_header) != 24:
+                break  # EOF
+            object_id, object_size = unpack_object_header(object_header)
             if object_size == 0 or object_size > self.filesize:
                 break  # invalid object, stop parsing.
-            if object_id == self._ASF_CONTENT_DESCRIPTION_OBJECT and self._parse_tags:
-                title_length = self._bytes_to_int_le(fh.read(2))
-                author_length = self._bytes_to_int_le(fh.read(2))
-                copyright_length = self._bytes_to_int_le(fh.read(2))
-                description_length = self._bytes_to_int_le(fh.read(2))
-                rating_length = self._bytes_to_int_le(fh.read(2))
-                data_blocks = {
-                    'title': title_length,
-                    'artist': author_length,
-                    'extra.copyright': copyright_length,
-                    'comment': description_length,
-                    '_rating': rating_length,
-                }
-                for i_field_name, length in data_blocks.items():
-                    bytestring = fh.read(length)
-                    if not i_field_name.startswith('_'):
-                        self._set_field(i_field_name, self._decode_string(bytestring))
-            elif object_id == self._ASF_EXTENDED_CONTENT_DESCRIPTION_OBJECT and self._parse_tags:
-                # http://web.archive.org/web/20131203084402/http://msdn.microsoft.com/en-us/library/bb643323.aspx#_Toc509555195
-                descriptor_count = self._bytes_to_int_le(fh.read(2))
-                for _ in range(descriptor_count):
-                    name_len = self._bytes_to_int_le(fh.read(2))
-                    name = self._decode_string(fh.read(name_len))
-                    value_type = self._bytes_to_int_le(fh.read(2))
-                    value_len = self._bytes_to_int_le(fh.read(2))
-                    if value_type == 1:
-                        fh.seek(value_len, os.SEEK_CUR)  # skip byte values
-                        continue
-                    field_name = self._ASF_MAPPING.get(name)  # try to get normalized field name
-                    if field_name is None:  # custom field
-                        if name.startswith('WM/'):
-                            name = name[3:]
-                        field_name = self._EXTRA_PREFIX + name.lower()
-                    field_value = self._decode_ext_desc(value_type, fh.read(value_len))
-                    if field_value is not None:
-                        if field_name in {'track', 'disc'}:
-                            if isinstance(field_value, int) or field_value.isdecimal():
-                                self._set_field(field_name, int(field_value))
-                        else:
-                            self._set_field(field_name, field_value)
-            elif object_id == self._ASF_FILE_PROPERTY_OBJECT and self._parse_duration:
-                fh.seek(40, os.SEEK_CUR)
-                play_duration = self._bytes_to_int_le(fh.read(8)) / 10000000
-                fh.seek(8, os.SEEK_CUR)
-                preroll = self._bytes_to_int_le(fh.read(8)) / 1000
-                fh.seek(16, os.SEEK_CUR)
-                # According to the specification, we need to subtract the preroll from play_duration
-                # to get the actual duration of the file
-                self.duration = max(play_duration - preroll, 0.0)
-            elif object_id == self._ASF_STREAM_PROPERTIES_OBJECT and self._parse_duration:
-                stream_type = fh.read(16)
-                fh.seek(24, os.SEEK_CUR)  # skip irrelevant fields
-                type_specific_data_length = self._bytes_to_int_le(fh.read(4))
-                error_correction_data_length = self._bytes_to_int_le(fh.read(4))
-                fh.seek(6, os.SEEK_CUR)   # skip irrelevant fields
-                already_read = 0
-                if stream_type == self._STREAM_TYPE_ASF_AUDIO_MEDIA:
-                    codec_id_format_tag = self._bytes_to_int_le(fh.read(2))
-                    self.channels = self._bytes_to_int_le(fh.read(2))
-                    self.samplerate = self._bytes_to_int_le(fh.read(4))
-                    avg_bytes_per_second = self._bytes_to_int_le(fh.read(4))
-                    self.bitrate = avg_bytes_per_second * 8 / 1000
-                    fh.seek(2, os.SEEK_CUR)  # skip irrelevant field
-                    bits_per_sample = self._bytes_to_int_le(fh.read(2))
-                    if codec_id_format_tag == 355:  # lossless
-                        self.bitdepth = bits_per_sample
-                    already_read = 16
-                fh.seek(type_specific_data_length - already_read, os.SEEK_CUR)
-                fh.seek(error_correction_data_length, os.SEEK_CUR)
+            object_handler = object_handlers.get(object_id)
+            if object_handler is not None:
+                object_handler(self, fh, object_size - 24)
+                # parse each object once, but keep looking until an audio stream is found
+                if object_id != self._ASF_STREAM_PROPERTIES_OBJECT or self.channels is not None:
+                    del object_handlers[object_id]
+                    if not object_handlers:
+                        break  # all needed objects were parsed, skip the remaining ones
             else:
                 fh.seek(object_size - 24, os.SEEK_CUR)  # read over onknown object ids
         self._tags_parsed = True
@@ -1736,30 +1952,38 @@ class _Aiff(TinyTag):
         b'ANNO': 'comment',
         b'(c) ': 'extra.copyright',
     }
+    _FORM_HEADER = struct.Struct('>4sI4s')
+    _CHUNK_HEADER = struct.Struct('>4sI')
+    _COMM_CHUNK = struct.Struct('>hLhHQ')
 
     def _parse_tag(self, fh: BinaryIO) -> None:
-        chunk_id, _size, form = struct.unpack('>4sI4s', fh.read(12))
+        chunk_id, _size, form = self._FORM_HEADER.unpack(fh.read(12))
         if chunk_id != b'FORM' or form not in (b'AIFC', b'AIFF'):
             raise ParseError('Invalid AIFF header')
+        unpack_chunk_header = self._CHUNK_HEADER.unpack
         chunk_header = fh.read(8)
         while len(chunk_header) == 8:
-            sub_chunk_id, sub_chunk_size = struct.unpack('>4sI', chunk_header)
+            sub_chunk_id, sub_chunk_size = unpack_chunk_header(chunk_header)
             sub_chunk_size += sub_chunk_size % 2  # IFF chunks are padded to an even number of bytes
             if sub_chunk_id in self._AIFF_MAPPING and self._parse_tags:
                 value = self._unpad(fh.read(sub_chunk_size).decode('utf-8', 'replace'))
                 self._set_field(self._AIFF_MAPPING[sub_chunk_id], value)
             elif sub_chunk_id == b'COMM' and self._parse_duration:
-                channels, num_frames, bitdepth = struct.unpack('>hLh', fh.read(8))
+                comm_chunk = fh.read(sub_chunk_size)  # read the whole (small) chunk at once
+                if len(comm_chunk) < self._COMM_CHUNK.size:
+                    raise ParseError('Invalid AIFF COMM chunk')
+                # sample rate is stored as 80 bit extended precision (exponent, mantissa)
+                channels, num_frames, bitdepth, exponent, mantissa = (
+                    self._COMM_CHUNK.unpack_from(comm_chunk))
                 self.channels, self.bitdepth = channels, bitdepth
+                shift = exponent - 0x3FFF - 63
+                samplerate = mantissa << shift if shift >= 0 else mantissa >> -shift
                 try:
-                    exponent, mantissa = struct.unpack('>HQ', fh.read(10))   # Extended precision
-                    samplerate = int(mantissa * (2 ** (exponent - 0x3FFF - 63)))
                     duration = num_frames / samplerate
                     bitrate = samplerate * channels * bitdepth / 1000
                     self.samplerate, self.duration, self.bitrate = samplerate, duration, bitrate
-                except OverflowError:
+                except (OverflowError, ZeroDivisionError):
                     pass
-                fh.seek(sub_chunk_size - 18, 1)  # skip remaining data in chunk
             elif sub_chunk_id in {b'id3 ', b'ID3 '} and self._parse_tags:
                 id3 = _ID3()
                 id3._filehandler = fh